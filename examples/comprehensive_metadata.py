@@ -2,7 +2,9 @@
 """
 Example demonstrating the comprehensive metadata now exposed by rugo.
 """
+import io
 import json
+import sys
 import rugo.parquet as parquet_meta
 
 
@@ -12,7 +14,7 @@ def main():
     print("=" * 70)
     
     # Read metadata
-    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
+    metadata = parquet_meta.read_metadata_cached('tests/data/planets.parquet')
     
     print(f"\n📊 File Statistics:")
     print(f"   Total rows: {metadata['num_rows']}")
@@ -25,54 +27,57 @@ def main():
     print(f"   Total bytes: {rg['total_byte_size']:,}")
     print(f"   Columns: {len(rg['columns'])}")
     
-    # Show detailed metadata for first few columns
-    print(f"\n📋 Column Details (first 3 columns):")
-    print(f"{'-' * 70}")
+    # Show detailed metadata for first few columns, buffering the report and
+    # writing it out once
+    out = io.StringIO()
+    print(f"\n📋 Column Details (first 3 columns):", file=out)
+    print(f"{'-' * 70}", file=out)
     
     for i, col in enumerate(rg['columns'][:3], 1):
-        print(f"\n{i}. {col['name']} ({col['type']} → {col['logical_type']})")
-        print(f"   Values: {col['num_values']}")
-        print(f"   Null count: {col['null_count']}")
+        print(f"\n{i}. {col['name']} ({col['type']} → {col['logical_type']})", file=out)
+        print(f"   Values: {col['num_values']}", file=out)
+        print(f"   Null count: {col['null_count']}", file=out)
         
         if col['distinct_count'] is not None:
-            print(f"   Distinct values: {col['distinct_count']}")
+            print(f"   Distinct values: {col['distinct_count']}", file=out)
         
-        print(f"   Size: {col['total_compressed_size']:,} bytes (compressed)")
-        print(f"         {col['total_uncompressed_size']:,} bytes (uncompressed)")
+        print(f"   Size: {col['total_compressed_size']:,} bytes (compressed)", file=out)
+        print(f"         {col['total_uncompressed_size']:,} bytes (uncompressed)", file=out)
         
         compression_ratio = col['total_uncompressed_size'] / col['total_compressed_size']
-        print(f"         {compression_ratio:.2f}x compression ratio")
+        print(f"         {compression_ratio:.2f}x compression ratio", file=out)
         
-        print(f"   Encodings: {', '.join(col['encodings'])}")
-        print(f"   Codec: {col['compression_codec']}")
+        print(f"   Encodings: {', '.join(col['encodings'])}", file=out)
+        print(f"   Codec: {col['compression_codec']}", file=out)
         
-        print(f"   Offsets:")
+        print(f"   Offsets:", file=out)
         if col['dictionary_page_offset'] is not None:
-            print(f"      Dictionary: {col['dictionary_page_offset']}")
-        print(f"      Data: {col['data_page_offset']}")
+            print(f"      Dictionary: {col['dictionary_page_offset']}", file=out)
+        print(f"      Data: {col['data_page_offset']}", file=out)
         if col['index_page_offset'] is not None:
-            print(f"      Index: {col['index_page_offset']}")
+            print(f"      Index: {col['index_page_offset']}", file=out)
         
         if col['bloom_offset'] is not None:
-            print(f"   Bloom filter: offset={col['bloom_offset']}, length={col['bloom_length']}")
+            print(f"   Bloom filter: offset={col['bloom_offset']}, length={col['bloom_length']}", file=out)
         
         if col['min'] is not None and col['max'] is not None:
-            print(f"   Range: [{col['min']}, {col['max']}]")
+            print(f"   Range: [{col['min']}, {col['max']}]", file=out)
         
         if col['key_value_metadata']:
-            print(f"   Custom metadata: {col['key_value_metadata']}")
+            print(f"   Custom metadata: {col['key_value_metadata']}", file=out)
     
-    print(f"\n{'-' * 70}")
+    print(f"\n{'-' * 70}", file=out)
     
     # Summary of all fields now exposed
-    print("\n✨ All Exposed Metadata Fields:")
+    print("\n✨ All Exposed Metadata Fields:", file=out)
     all_fields = list(rg['columns'][0].keys())
     all_fields.sort()
     for field in all_fields:
-        print(f"   • {field}")
+        print(f"   • {field}", file=out)
     
-    print(f"\n✅ Total: {len(all_fields)} fields per column (up from 8 previously)")
-    print()
+    print(f"\n✅ Total: {len(all_fields)} fields per column (up from 8 previously)", file=out)
+    print(file=out)
+    sys.stdout.write(out.getvalue())
 
 
 if __name__ == "__main__":
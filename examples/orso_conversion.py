@@ -6,9 +6,13 @@ This script shows how to use rugo to read parquet metadata and convert
 it to an orso RelationSchema for further processing.
 """
 
+import functools
 import glob
+import io
+import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add current directory to path for running from repo
@@ -29,74 +33,81 @@ except ImportError:
 def main():
     print("🚀 Rugo to Orso Schema Conversion Example\n")
     
-    # Find a test parquet file
-    files_to_test = glob.glob("tests/data/*.parquet")
+    # Find the test parquet files
+    files_to_test = [Path(f) for f in sorted(glob.glob("tests/data/*.parquet"))]
+    if not files_to_test:
+        print("❌ No test files found in tests/data")
+        print("Please run this from the rugo repository root directory.")
+        return 1
 
-    for test_file in files_to_test:
+    # Read all footers up front; rugo releases the GIL while parsing so the
+    # files are processed in parallel. Set RUGO_CACHE_DIR to reuse the parsed
+    # footers across runs.
+    read = functools.partial(
+        parquet_meta.read_metadata_cached, cache_dir=os.environ.get("RUGO_CACHE_DIR")
+    )
+    start_time = time.time()
+    parquet_meta.prefetch_footers(files_to_test)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        all_metadata = list(executor.map(read, map(str, files_to_test)))
+    rugo_time = time.time() - start_time
 
-        test_file = Path(test_file)
-        if not test_file.exists():
-            print(f"❌ Test file not found: {test_file}")
-            print("Please run this from the rugo repository root directory.")
-            return 1
-        
-        print(f"📁 Reading metadata from: {test_file}")
-        
-        # Read parquet metadata with rugo
-        start_time = time.time()
-        metadata = parquet_meta.read_metadata(str(test_file))
-        rugo_time = time.time() - start_time
-        
-        print(f"⚡ Rugo metadata extraction: {rugo_time*1000:.2f}ms")
-        print(f"📊 Total rows: {metadata['num_rows']}")
-        print(f"🗂️  Row groups: {len(metadata['row_groups'])}")
-        print(f"📋 Columns: {len(metadata['row_groups'][0]['columns'])}")
+    print(f"⚡ Rugo metadata extraction ({len(files_to_test)} files): {rugo_time*1000:.2f}ms\n")
+
+    for test_file, metadata in zip(files_to_test, all_metadata):
+        # each file's report is written in one go rather than line by line
+        out = io.StringIO()
+
+        print(f"📁 Metadata from: {test_file}", file=out)
+        print(f"📊 Total rows: {metadata['num_rows']}", file=out)
+        print(f"🗂️  Row groups: {len(metadata['row_groups'])}", file=out)
+        print(f"📋 Columns: {len(metadata['row_groups'][0]['columns'])}", file=out)
         
-        print("\n📝 Rugo Schema (first 5 columns):")
+        print("\n📝 Rugo Schema (first 5 columns):", file=out)
         for i, col in enumerate(metadata['row_groups'][0]['columns'][:5]):
             logical = col.get('logical_type', 'inferred')
-            print(f"  {i+1}. {col['name']}: {col['type']} -> {logical}")
+            print(f"  {i+1}. {col['name']}: {col['type']} -> {logical}", file=out)
         
         if not ORSO_AVAILABLE:
-            print("\n⚠️  Orso conversion not available (orso package not installed)")
+            print("\n⚠️  Orso conversion not available (orso package not installed)", file=out)
+            sys.stdout.write(out.getvalue())
             return 0
         
-        print("\n🔄 Converting to Orso schema...")
+        print("\n🔄 Converting to Orso schema...", file=out)
         
         # Convert to orso RelationSchema
         start_time = time.time()
         orso_schema = rugo_to_orso_schema(metadata, "planets_dataset")
         convert_time = time.time() - start_time
         
-        print(f"⚡ Conversion time: {convert_time*1000:.2f}ms")
+        print(f"⚡ Conversion time: {convert_time*1000:.2f}ms", file=out)
         
-        print("\n🎯 Orso RelationSchema:")
-        print(f"  Schema name: {orso_schema.name}")
-        print(f"  Row count estimate: {orso_schema.row_count_estimate}")
-        print(f"  Number of columns: {len(orso_schema.columns)}")
+        print("\n🎯 Orso RelationSchema:", file=out)
+        print(f"  Schema name: {orso_schema.name}", file=out)
+        print(f"  Row count estimate: {orso_schema.row_count_estimate}", file=out)
+        print(f"  Number of columns: {len(orso_schema.columns)}", file=out)
         
-        print("\n📋 Orso Columns (first 5):")
+        print("\n📋 Orso Columns (first 5):", file=out)
         for i, col in enumerate(orso_schema.columns[:5]):
             nullable = "nullable" if col.nullable else "not null"
-            print(f"  {i+1}. {col.name}: {col.type} ({nullable})")
+            print(f"  {i+1}. {col.name}: {col.type} ({nullable})", file=out)
         
         # Show simplified extraction
-        print("\n🔍 Simplified schema extraction:")
-        schema_info = extract_schema_only(metadata, "simple_schema")
-        print(f"  Schema: {schema_info['schema_name']}")
-        print(f"  Rows: {schema_info['row_count']}")
-        print("  Column types:")
+        print("\n🔍 Simplified schema extraction:", file=out)
+        schema_info = extract_schema_only(orso_schema, "simple_schema")
+        print(f"  Schema: {schema_info['schema_name']}", file=out)
+        print(f"  Rows: {schema_info['row_count']}", file=out)
+        print("  Column types:", file=out)
         for name, type_name in list(schema_info['columns'].items())[:5]:
-            print(f"    {name}: {type_name}")
+            print(f"    {name}: {type_name}", file=out)
         
-        print("\n✅ Conversion completed successfully!")
+        print("\n✅ Conversion completed successfully!", file=out)
         
         # Performance comparison note
-        print("\n📈 Performance Summary:")
-        print(f"  • Rugo metadata extraction: {rugo_time*1000:.2f}ms")
-        print(f"  • Schema conversion: {convert_time*1000:.2f}ms")
-        print(f"  • Total time: {(rugo_time + convert_time)*1000:.2f}ms")
-        print()
+        print("\n📈 Performance Summary:", file=out)
+        print(f"  • Schema conversion: {convert_time*1000:.2f}ms", file=out)
+        print(file=out)
+        sys.stdout.write(out.getvalue())
     
     return 0
 
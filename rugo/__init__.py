@@ -5,21 +5,35 @@ A lightning-fast Parquet metadata reader built with C++ and Cython.
 Optimized for ultra-fast metadata extraction and analysis.
 """
 
-try:
-    from importlib.metadata import version
-
-    __version__ = version("rugo")
-except Exception:
-    # Fallback version for development/editable installs
-    __version__ = "0.0.0"
+from importlib.util import find_spec
 
 __author__ = "Mabel Dev"
 
-# Import converters for easy access
-try:
-    from .converters import rugo_to_orso_schema
-
+# The version and the converters are resolved on first use; importlib.metadata
+# and orso are both slow to import and would otherwise be paid by every
+# "import rugo.parquet"
+if find_spec("orso") is not None:
     __all__ = ["rugo_to_orso_schema"]
-except ImportError:
+else:
     # orso may not be available
     __all__ = []
+
+
+def __getattr__(name):
+    if name == "__version__":
+        try:
+            from importlib.metadata import version
+
+            value = version("rugo")
+        except Exception:
+            # Fallback version for development/editable installs
+            value = "0.0.0"
+    elif name in __all__:
+        from .converters import rugo_to_orso_schema
+
+        value = rugo_to_orso_schema
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
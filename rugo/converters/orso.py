@@ -4,7 +4,10 @@ Convert rugo parquet metadata schemas to orso RelationSchema format.
 
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from orso.schema import FlatColumn
 from orso.schema import RelationSchema
@@ -60,27 +63,57 @@ def _map_parquet_type_to_orso(
             _type._element_type = _element_type
             return _type
 
-    # Fall back to physical type mapping
-    physical_lower = parquet_type.lower()
+    # Fall back to physical type mapping, defaulting to VARCHAR for unknown types
+    return _PHYSICAL_TYPES.get(parquet_type.lower(), OrsoTypes.VARCHAR)
 
-    # Integer types
-    if physical_lower in ("int8", "int16", "int32", "int64"):
-        return OrsoTypes.INTEGER
 
+_PHYSICAL_TYPES = {
+    # Integer types
+    "int8": OrsoTypes.INTEGER,
+    "int16": OrsoTypes.INTEGER,
+    "int32": OrsoTypes.INTEGER,
+    "int64": OrsoTypes.INTEGER,
     # Floating point types
-    if physical_lower in ("float", "float32", "float64", "double"):
-        return OrsoTypes.DOUBLE
-
+    "float": OrsoTypes.DOUBLE,
+    "float32": OrsoTypes.DOUBLE,
+    "float64": OrsoTypes.DOUBLE,
+    "double": OrsoTypes.DOUBLE,
     # Binary/string types
-    if physical_lower in ("byte_array", "fixed_len_byte_array"):
-        return OrsoTypes.VARCHAR
-
+    "byte_array": OrsoTypes.VARCHAR,
+    "fixed_len_byte_array": OrsoTypes.VARCHAR,
     # Boolean type
-    if physical_lower == "boolean":
-        return OrsoTypes.BOOLEAN
+    "boolean": OrsoTypes.BOOLEAN,
+}
 
-    # Default to VARCHAR for unknown types
-    return OrsoTypes.VARCHAR
+
+def _column_arrays(
+    row_groups: Any,
+) -> Tuple[List[str], List[str], List[Any], List[Any]]:
+    """
+    Return names, physical types, logical types and null counts of the first row group.
+
+    Row groups read by rugo.parquet expose the columns as parallel arrays, which
+    avoids building a dictionary per column; plain lists of dictionaries are
+    validated and read field by field.
+    """
+    if hasattr(row_groups, "columns_soa"):
+        soa = row_groups.columns_soa(0)
+        null_counts = [None if count < 0 else count for count in soa.null_counts]
+        return soa.names, soa.types, soa.logical_types, null_counts
+
+    first_row_group = row_groups[0]
+    if "columns" not in first_row_group:
+        raise ValueError("Row group must contain 'columns' key")
+
+    names, types, logical_types, null_counts = [], [], [], []
+    for col_metadata in first_row_group["columns"]:
+        if "name" not in col_metadata or "type" not in col_metadata:
+            raise ValueError("Column metadata must contain 'name' and 'type' keys")
+        names.append(col_metadata["name"])
+        types.append(col_metadata["type"])
+        logical_types.append(col_metadata.get("logical_type"))
+        null_counts.append(col_metadata.get("null_count", 0))
+    return names, types, logical_types, null_counts
 
 
 def rugo_to_orso_schema(
@@ -109,23 +142,18 @@ def rugo_to_orso_schema(
         raise ValueError("rugo_metadata must contain at least one row group")
 
     # Get columns from the first row group (schema should be consistent across row groups)
-    first_row_group = rugo_metadata["row_groups"][0]
-
-    if "columns" not in first_row_group:
-        raise ValueError("Row group must contain 'columns' key")
+    names, types, logical_types, null_counts = _column_arrays(
+        rugo_metadata["row_groups"]
+    )
 
     columns = []
     seen_structs = set()
-    for col_metadata in first_row_group["columns"]:
-        if "name" not in col_metadata or "type" not in col_metadata:
-            raise ValueError("Column metadata must contain 'name' and 'type' keys")
-
-        col_name = col_metadata["name"]
-        physical_type = col_metadata["type"]
-        logical_type = col_metadata.get("logical_type")
-
-        top_name = col_name.split(".", 1)[0]
-        if top_name != col_name:
+    for col_name, physical_type, logical_type, null_count in zip(
+        names, types, logical_types, null_counts
+    ):
+        dot = col_name.find(".")
+        if dot >= 0:
+            top_name = col_name[:dot]
             if top_name in seen_structs:
                 continue  # Already processed this struct
             col_name = top_name
@@ -136,23 +164,17 @@ def rugo_to_orso_schema(
         # Map to orso type
         orso_type = _map_parquet_type_to_orso(physical_type, logical_type)
 
-        # Create orso column
-        orso_column = FlatColumn(
-            name=col_name,
-            type=orso_type,
-            nullable=col_metadata.get("null_count", 0) > 0,
+        # Create orso column; an unknown null count may hide nulls
+        columns.append(
+            FlatColumn(
+                name=col_name,
+                type=orso_type,
+                nullable=null_count is None or null_count > 0,
+            )
         )
 
-        columns.append(orso_column)
-
-    # Create and populate the RelationSchema
-    schema = RelationSchema(name=schema_name)
-
-    # Add all columns to the schema
-    for column in columns:
-        schema.columns.append(column)
-
-    # Add row count estimate if available
+    # Create the RelationSchema, with a row count estimate if available
+    schema = RelationSchema(name=schema_name, columns=columns)
     if "num_rows" in rugo_metadata:
         schema.row_count_estimate = rugo_metadata["num_rows"]
 
@@ -160,19 +182,25 @@ def rugo_to_orso_schema(
 
 
 def extract_schema_only(
-    rugo_metadata: Dict[str, Any], schema_name: str = "parquet_schema"
+    rugo_metadata: Union[Dict[str, Any], RelationSchema],
+    schema_name: str = "parquet_schema",
 ) -> Dict[str, str]:
     """
     Extract just the column name to type mapping from rugo metadata.
 
     Args:
-        rugo_metadata: The metadata dictionary returned by rugo.parquet.read_metadata()
+        rugo_metadata: The metadata dictionary returned by rugo.parquet.read_metadata(),
+            or a RelationSchema already produced by rugo_to_orso_schema() to avoid
+            converting the same metadata twice
         schema_name: Name for the schema (included in result for completeness)
 
     Returns:
         Dictionary with schema name and column type mappings
     """
-    orso_schema = rugo_to_orso_schema(rugo_metadata, schema_name)
+    if isinstance(rugo_metadata, RelationSchema):
+        orso_schema = rugo_metadata
+    else:
+        orso_schema = rugo_to_orso_schema(rugo_metadata, schema_name)
 
     column_types = {}
     for column in orso_schema.columns:
@@ -0,0 +1,187 @@
+#pragma once
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+#if (defined(__x86_64__) || defined(__i386__)) &&                              \
+    (defined(__GNUC__) || defined(__clang__))
+#include <cpuid.h>
+#include <immintrin.h>
+#define RUGO_SBBF_AVX2 1
+#endif
+
+// ------------------- XXH64 -------------------
+// Parquet bloom filters hash the plain-encoded value with XXH64, seed 0.
+
+static const uint64_t XXH_PRIME64_1 = 0x9E3779B185EBCA87ULL;
+static const uint64_t XXH_PRIME64_2 = 0xC2B2AE3D27D4EB4FULL;
+static const uint64_t XXH_PRIME64_3 = 0x165667B19E3779F9ULL;
+static const uint64_t XXH_PRIME64_4 = 0x85EBCA77C2B2AE63ULL;
+static const uint64_t XXH_PRIME64_5 = 0x27D4EB2F165667C5ULL;
+
+static inline uint64_t XXHRotl64(uint64_t x, int r) {
+  return (x << r) | (x >> (64 - r));
+}
+
+static inline uint64_t XXHRead64(const uint8_t *p) {
+  uint64_t v;
+  std::memcpy(&v, p, 8);
+  return v;
+}
+
+static inline uint32_t XXHRead32(const uint8_t *p) {
+  uint32_t v;
+  std::memcpy(&v, p, 4);
+  return v;
+}
+
+static inline uint64_t XXHRound(uint64_t acc, uint64_t input) {
+  acc += input * XXH_PRIME64_2;
+  acc = XXHRotl64(acc, 31);
+  return acc * XXH_PRIME64_1;
+}
+
+static inline uint64_t XXHMergeRound(uint64_t acc, uint64_t val) {
+  acc ^= XXHRound(0, val);
+  return acc * XXH_PRIME64_1 + XXH_PRIME64_4;
+}
+
+static inline uint64_t XXH64(const uint8_t *p, size_t len, uint64_t seed = 0) {
+  const uint8_t *end = p + len;
+  uint64_t h;
+
+  if (len >= 32) {
+    uint64_t v1 = seed + XXH_PRIME64_1 + XXH_PRIME64_2;
+    uint64_t v2 = seed + XXH_PRIME64_2;
+    uint64_t v3 = seed;
+    uint64_t v4 = seed - XXH_PRIME64_1;
+    const uint8_t *limit = end - 32;
+    do {
+      v1 = XXHRound(v1, XXHRead64(p));
+      v2 = XXHRound(v2, XXHRead64(p + 8));
+      v3 = XXHRound(v3, XXHRead64(p + 16));
+      v4 = XXHRound(v4, XXHRead64(p + 24));
+      p += 32;
+    } while (p <= limit);
+    h = XXHRotl64(v1, 1) + XXHRotl64(v2, 7) + XXHRotl64(v3, 12) +
+        XXHRotl64(v4, 18);
+    h = XXHMergeRound(h, v1);
+    h = XXHMergeRound(h, v2);
+    h = XXHMergeRound(h, v3);
+    h = XXHMergeRound(h, v4);
+  } else {
+    h = seed + XXH_PRIME64_5;
+  }
+
+  h += (uint64_t)len;
+
+  while (p + 8 <= end) {
+    h ^= XXHRound(0, XXHRead64(p));
+    h = XXHRotl64(h, 27) * XXH_PRIME64_1 + XXH_PRIME64_4;
+    p += 8;
+  }
+  if (p + 4 <= end) {
+    h ^= (uint64_t)XXHRead32(p) * XXH_PRIME64_1;
+    h = XXHRotl64(h, 23) * XXH_PRIME64_2 + XXH_PRIME64_3;
+    p += 4;
+  }
+  while (p < end) {
+    h ^= (uint64_t)(*p) * XXH_PRIME64_5;
+    h = XXHRotl64(h, 11) * XXH_PRIME64_1;
+    p++;
+  }
+
+  h ^= h >> 33;
+  h *= XXH_PRIME64_2;
+  h ^= h >> 29;
+  h *= XXH_PRIME64_3;
+  h ^= h >> 32;
+  return h;
+}
+
+// ------------------- Split Block Bloom Filter -------------------
+// The bitset is a sequence of 256-bit blocks, each eight little-endian
+// 32-bit words. The upper half of the hash selects the block, the lower half
+// sets one bit in each word.
+
+static const uint32_t SBBF_SALT[8] = {0x47b6137bU, 0x44974d91U, 0x8824ad5bU,
+                                      0xa2b7289dU, 0x705495c7U, 0x2df1424bU,
+                                      0x9efc4947U, 0x5c6bfb31U};
+
+static const size_t SBBF_BYTES_PER_BLOCK = 32;
+
+static inline bool SbbfBlockCheckScalar(const uint8_t *block, uint32_t key) {
+  for (int i = 0; i < 8; i++) {
+    uint32_t mask = 1U << ((key * SBBF_SALT[i]) >> 27);
+    if ((XXHRead32(block + i * 4) & mask) == 0)
+      return false;
+  }
+  return true;
+}
+
+#ifdef RUGO_SBBF_AVX2
+// All eight salted bit positions are computed in one 256-bit lane set and the
+// block is tested with a single VPTEST.
+__attribute__((target("avx2"))) static inline bool
+SbbfBlockCheckAvx2(const uint8_t *block, uint32_t key) {
+  const __m256i salt = _mm256_setr_epi32(
+      (int)SBBF_SALT[0], (int)SBBF_SALT[1], (int)SBBF_SALT[2],
+      (int)SBBF_SALT[3], (int)SBBF_SALT[4], (int)SBBF_SALT[5],
+      (int)SBBF_SALT[6], (int)SBBF_SALT[7]);
+  __m256i bits =
+      _mm256_srli_epi32(_mm256_mullo_epi32(_mm256_set1_epi32((int)key), salt), 27);
+  __m256i mask = _mm256_sllv_epi32(_mm256_set1_epi32(1), bits);
+  __m256i words = _mm256_loadu_si256((const __m256i *)block);
+  return _mm256_testc_si256(words, mask) != 0;
+}
+
+// AVX2 needs both CPU support and the OS saving YMM state (OSXSAVE + XCR0).
+static inline bool CpuHasAvx2() {
+  unsigned int eax, ebx, ecx, edx;
+  if (!__get_cpuid(1, &eax, &ebx, &ecx, &edx))
+    return false;
+  if (!(ecx & (1U << 27)) || !(ecx & (1U << 28)))
+    return false;
+  unsigned int xcr0_lo, xcr0_hi;
+  __asm__("xgetbv" : "=a"(xcr0_lo), "=d"(xcr0_hi) : "c"(0));
+  if ((xcr0_lo & 0x6) != 0x6)
+    return false;
+  if (!__get_cpuid_count(7, 0, &eax, &ebx, &ecx, &edx))
+    return false;
+  return (ebx & (1U << 5)) != 0;
+}
+
+static inline bool SbbfUseAvx2() {
+  static const bool use_avx2 = CpuHasAvx2();
+  return use_avx2;
+}
+#endif
+
+static inline const uint8_t *SbbfBlock(const uint8_t *bitset,
+                                       size_t num_bytes, uint64_t hash) {
+  uint64_t num_blocks = num_bytes / SBBF_BYTES_PER_BLOCK;
+  uint64_t block_index = ((hash >> 32) * num_blocks) >> 32;
+  return bitset + block_index * SBBF_BYTES_PER_BLOCK;
+}
+
+// Hint that the block for hash will be probed shortly.
+static inline void SbbfPrefetch(const uint8_t *bitset, size_t num_bytes,
+                                uint64_t hash) {
+#if defined(__GNUC__) || defined(__clang__)
+  if (num_bytes >= SBBF_BYTES_PER_BLOCK)
+    __builtin_prefetch(SbbfBlock(bitset, num_bytes, hash));
+#endif
+}
+
+static inline bool SbbfCheck(const uint8_t *bitset, size_t num_bytes,
+                             uint64_t hash) {
+  if (num_bytes < SBBF_BYTES_PER_BLOCK)
+    return true; // an empty filter cannot rule anything out
+  const uint8_t *block = SbbfBlock(bitset, num_bytes, hash);
+  uint32_t key = (uint32_t)hash;
+#ifdef RUGO_SBBF_AVX2
+  if (SbbfUseAvx2())
+    return SbbfBlockCheckAvx2(block, key);
+#endif
+  return SbbfBlockCheckScalar(block, key);
+}
@@ -1,5 +1,7 @@
 #include "metadata.hpp"
+#include "bloom_filter.hpp"
 #include "thrift.hpp"
+#include <algorithm>
 #include <cstring>
 #include <fstream>
 #include <iostream>
@@ -7,11 +9,19 @@
 
 // ------------------- Helpers -------------------
 
-static inline uint32_t ReadLE32(const uint8_t *p) {
-  return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) |
-         ((uint32_t)p[3] << 24);
+// A single unaligned 8-byte load, byte-swapped on big-endian hosts.
+static inline uint64_t ReadLE64(const uint8_t *p) {
+  uint64_t v;
+  std::memcpy(&v, p, 8);
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+  v = __builtin_bswap64(v);
+#endif
+  return v;
 }
 
+// "PAR1" read as the upper half of the little-endian trailer
+static const uint32_t PARQUET_MAGIC = 0x31524150u;
+
 static inline const char *ParquetTypeToString(int t) {
   switch (t) {
   case 0:
@@ -429,6 +439,7 @@ static SchemaElement ParseSchemaElement(TInput &in) {
 // 6: optional binary min_value
 static void ParseStatistics(TInput &in, ColumnStats &cs) {
   std::string legacy_min, legacy_max, v2_min, v2_max;
+  bool has_v2_min = false, has_v2_max = false;
   int16_t last_id = 0;
   while (true) {
     auto fh = ReadFieldHeader(in, last_id);
@@ -449,17 +460,22 @@ static void ParseStatistics(TInput &in, ColumnStats &cs) {
       break;
     case 5:
       v2_max = ReadString(in);
+      has_v2_max = true;
       break;
     case 6:
       v2_min = ReadString(in);
+      has_v2_min = true;
       break;
     default:
       SkipField(in, fh.type);
       break;
     }
   }
-  cs.min = !v2_min.empty() ? v2_min : legacy_min;
-  cs.max = !v2_max.empty() ? v2_max : legacy_max;
+  // The deprecated fields were written with signed byte ordering by older
+  // writers (PARQUET-686), so callers need to know which ones were used.
+  cs.min = has_v2_min ? v2_min : legacy_min;
+  cs.max = has_v2_max ? v2_max : legacy_max;
+  cs.min_max_v2 = has_v2_min && has_v2_max;
 }
 
 // parquet.thrift ColumnMetaData
@@ -494,6 +510,7 @@ static void ParseColumnMeta(TInput &in, ColumnStats &cs) {
     }
     case 2: { // encodings
       auto lh = ReadListHeader(in);
+      cs.encodings.reserve(std::min<size_t>(lh.size, (size_t)(in.end - in.p)));
       for (uint32_t i = 0; i < lh.size; i++) {
         int32_t enc = ReadVarint(in);
         cs.encodings.push_back(enc);
@@ -625,6 +642,8 @@ static void ParseRowGroup(TInput &in, RowGroupStats &rg) {
     switch (fh.id) {
     case 1: { // columns: list<ColumnChunk>
       auto lh = ReadListHeader(in);
+      // every element takes at least one byte, which bounds a corrupt size
+      rg.columns.reserve(std::min<size_t>(lh.size, (size_t)(in.end - in.p)));
       for (uint32_t i = 0; i < lh.size; i++) {
         ColumnStats cs;
         ParseColumnChunk(in, cs); // <-- go via ColumnChunk
@@ -843,14 +862,14 @@ FileStats ReadParquetMetadataFromBuffer(const uint8_t *buf, size_t size) {
     throw std::runtime_error("Buffer too small");
   }
 
-  // trailer is always last 8 bytes
-  const uint8_t *trailer = buf + size - 8;
+  // trailer is always last 8 bytes: footer length, then the magic
+  uint64_t trailer = ReadLE64(buf + size - 8);
 
-  if (memcmp(trailer + 4, "PAR1", 4) != 0)
+  if ((uint32_t)(trailer >> 32) != PARQUET_MAGIC)
     throw std::runtime_error("Not a parquet file");
 
-  uint32_t footer_len = ReadLE32(trailer);
-  if (footer_len + 8 > size)
+  uint64_t footer_len = (uint32_t)trailer;
+  if (footer_len > size - 8)
     throw std::runtime_error("Footer length invalid");
 
   const uint8_t *footer_start = buf + size - 8 - footer_len;
@@ -870,3 +889,157 @@ FileStats ReadParquetMetadataFromBuffer(const uint8_t *buf, size_t size) {
 
   return fs;
 }
+
+// ------------------- Bloom filters -------------------
+
+// The header is a handful of small varints; this comfortably covers it.
+static const int64_t BLOOM_HEADER_READ_SIZE = 64;
+
+// The algorithm, hash and compression fields are unions; the only member
+// defined by the spec for each is field 1 (BLOCK, XXHASH, UNCOMPRESSED).
+static void ExpectUnionMember(TInput &in, const char *what) {
+  int16_t last_id = 0;
+  bool found = false;
+  while (true) {
+    auto fh = ReadFieldHeader(in, last_id);
+    if (fh.type == 0)
+      break;
+    if (fh.id == 1)
+      found = true;
+    SkipField(in, fh.type);
+  }
+  if (!found)
+    throw std::runtime_error(std::string("Unsupported bloom filter ") + what);
+}
+
+// parquet.thrift BloomFilterHeader
+// 1: required i32 numBytes
+// 2: required BloomFilterAlgorithm algorithm
+// 3: required BloomFilterHash hash
+// 4: required BloomFilterCompression compression
+static int32_t ParseBloomFilterHeader(TInput &in) {
+  int32_t num_bytes = -1;
+  int16_t last_id = 0;
+  while (true) {
+    auto fh = ReadFieldHeader(in, last_id);
+    if (fh.type == 0)
+      break;
+    switch (fh.id) {
+    case 1:
+      num_bytes = ReadI32(in);
+      break;
+    case 2:
+      ExpectUnionMember(in, "algorithm");
+      break;
+    case 3:
+      ExpectUnionMember(in, "hash");
+      break;
+    case 4:
+      ExpectUnionMember(in, "compression");
+      break;
+    default:
+      SkipField(in, fh.type);
+      break;
+    }
+  }
+  if (num_bytes <= 0)
+    throw std::runtime_error("Invalid bloom filter header");
+  return num_bytes;
+}
+
+static std::string ReadFileRange(std::ifstream &file, int64_t offset,
+                                 int64_t length) {
+  std::string buf((size_t)length, '\0');
+  file.clear();
+  file.seekg(offset);
+  file.read(&buf[0], length);
+  buf.resize((size_t)file.gcount());
+  return buf;
+}
+
+static std::ifstream OpenBloomFile(const std::string &file_path) {
+  std::ifstream file(file_path, std::ios::binary);
+  if (!file)
+    throw std::runtime_error("Unable to open file: " + file_path);
+  return file;
+}
+
+// Read the header at bloom_offset and the bitset that follows it. When the
+// footer recorded bloom_length both come back in a single read; otherwise the
+// header is read first to learn the bitset size.
+static std::string LoadBloomFilter(std::ifstream &file, int64_t bloom_offset,
+                                   int64_t bloom_length) {
+  if (bloom_offset < 0)
+    throw std::runtime_error("Invalid bloom filter offset");
+
+  bool whole = bloom_length > 0;
+  std::string buf = ReadFileRange(
+      file, bloom_offset, whole ? bloom_length : BLOOM_HEADER_READ_SIZE);
+  const uint8_t *start = (const uint8_t *)buf.data();
+  TInput in{start, start + buf.size()};
+  int32_t num_bytes = ParseBloomFilterHeader(in);
+  int64_t header_len = (int64_t)(in.p - start);
+
+  if (bloom_length >= 0 && header_len + num_bytes > bloom_length)
+    throw std::runtime_error("Bloom filter length mismatch");
+
+  if (!whole)
+    buf = ReadFileRange(file, bloom_offset + header_len, num_bytes);
+  else
+    buf.erase(0, (size_t)header_len);
+  if ((int64_t)buf.size() < num_bytes)
+    throw std::runtime_error("Bloom filter truncated");
+  buf.resize((size_t)num_bytes);
+  return buf;
+}
+
+std::vector<uint8_t> TestBloomFilterBatch(const std::string &file_path,
+                                          int64_t bloom_offset,
+                                          int64_t bloom_length,
+                                          const std::vector<std::string> &values) {
+  std::ifstream file = OpenBloomFile(file_path);
+  std::string bitset = LoadBloomFilter(file, bloom_offset, bloom_length);
+  const uint8_t *bits = (const uint8_t *)bitset.data();
+
+  size_t num_bytes = bitset.size();
+
+  // Hash everything first, prefetching each target block, then probe. The
+  // hash loop is pure arithmetic and the probe loop finds its blocks in cache.
+  std::vector<uint64_t> hashes(values.size());
+  for (size_t i = 0; i < values.size(); i++) {
+    hashes[i] = XXH64((const uint8_t *)values[i].data(), values[i].size());
+    SbbfPrefetch(bits, num_bytes, hashes[i]);
+  }
+
+  std::vector<uint8_t> results(values.size());
+  for (size_t i = 0; i < hashes.size(); i++) {
+    results[i] = SbbfCheck(bits, num_bytes, hashes[i]) ? 1 : 0;
+  }
+  return results;
+}
+
+bool TestBloomFilter(const std::string &file_path, int64_t bloom_offset,
+                     int64_t bloom_length, const std::string &value) {
+  return TestBloomFilterBatch(file_path, bloom_offset, bloom_length, {value})[0] != 0;
+}
+
+std::vector<uint8_t>
+TestBloomFilterColumn(const std::string &file_path,
+                      const std::vector<int64_t> &bloom_offsets,
+                      const std::vector<int64_t> &bloom_lengths,
+                      const std::string &value) {
+  // One open and one hash serve every row group's filter.
+  std::ifstream file = OpenBloomFile(file_path);
+  uint64_t hash = XXH64((const uint8_t *)value.data(), value.size());
+
+  std::vector<uint8_t> results(bloom_offsets.size());
+  for (size_t i = 0; i < bloom_offsets.size(); i++) {
+    if (bloom_offsets[i] < 0) {
+      results[i] = 1; // no filter, so the value might be present
+      continue;
+    }
+    std::string bitset = LoadBloomFilter(file, bloom_offsets[i], bloom_lengths[i]);
+    results[i] = SbbfCheck((const uint8_t *)bitset.data(), bitset.size(), hash) ? 1 : 0;
+  }
+  return results;
+}
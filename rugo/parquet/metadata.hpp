@@ -27,6 +27,8 @@ struct ColumnStats {
   // Statistics
   std::string min;
   std::string max;
+  bool min_max_v2 = false; // min/max came from min_value/max_value, not the
+                           // deprecated min/max fields
   int64_t null_count = -1;
   int64_t distinct_count = -1;
 
@@ -75,6 +77,19 @@ inline FileStats ReadParquetMetadataC(const char *path) {
 const char *EncodingToString(int32_t enc);
 const char *CompressionCodecToString(int32_t codec);
 
-// New functions for bloom filter testing
+// Bloom filter testing; a false result means the value is definitely absent.
+// bloom_length may be -1 when the writer did not record it.
 bool TestBloomFilter(const std::string &file_path, int64_t bloom_offset,
-                     int64_t bloom_length, const std::string &value);
\ No newline at end of file
+                     int64_t bloom_length, const std::string &value);
+std::vector<uint8_t> TestBloomFilterBatch(const std::string &file_path,
+                                          int64_t bloom_offset,
+                                          int64_t bloom_length,
+                                          const std::vector<std::string> &values);
+
+// Test one value against a bloom filter per row group, opening the file once.
+// Row groups with a negative offset have no filter and report 1.
+std::vector<uint8_t>
+TestBloomFilterColumn(const std::string &file_path,
+                      const std::vector<int64_t> &bloom_offsets,
+                      const std::vector<int64_t> &bloom_lengths,
+                      const std::string &value);
\ No newline at end of file
@@ -24,6 +24,7 @@ cdef extern from "metadata.hpp":
         # Statistics
         string min
         string max
+        bint min_max_v2
         int64_t null_count
         int64_t distinct_count
         
@@ -47,9 +48,11 @@ cdef extern from "metadata.hpp":
         long long num_rows
         vector[RowGroupStats] row_groups
 
-    FileStats ReadParquetMetadataC(const char* path)
-    FileStats ReadParquetMetadataFromBuffer(const uint8_t* buf, size_t size)
-    bint TestBloomFilter(const string& file_path, long long bloom_offset, long long bloom_length, const string& value)
+    FileStats ReadParquetMetadataC(const char* path) except +
+    FileStats ReadParquetMetadataFromBuffer(const uint8_t* buf, size_t size) except + nogil
+    bint TestBloomFilter(const string& file_path, int64_t bloom_offset, int64_t bloom_length, const string& value) except + nogil
+    vector[uint8_t] TestBloomFilterBatch(const string& file_path, int64_t bloom_offset, int64_t bloom_length, const vector[string]& values) except + nogil
+    vector[uint8_t] TestBloomFilterColumn(const string& file_path, const vector[int64_t]& bloom_offsets, const vector[int64_t]& bloom_lengths, const string& value) except + nogil
     
     # Helper functions
     const char* EncodingToString(int32_t enc)
@@ -8,25 +8,37 @@
 # cython: infer_types=True
 
 import datetime
+import functools
+import hashlib
+from collections import namedtuple
+from collections.abc import Sequence
+import mmap
+import os
+import pickle
 import struct
 
+cimport cython
 cimport metadata_reader
+from cython.operator cimport dereference as deref
+from cpython cimport array
+from libc.stdint cimport int32_t
+from libc.stdint cimport int64_t
 from libc.stdint cimport uint8_t
 from libcpp.string cimport string
+from libcpp.unordered_set cimport unordered_set
+from libcpp.utility cimport move
+from libcpp.vector cimport vector
 
 
 # --- value decoder ---
-cdef object decode_value(string physical_type, string logical_type, string raw):
+cdef object decode_value(str type_str, str logical_str, string raw):
+    # type_str and logical_str are decoded once per column by the caller
     cdef bytes b = raw
     if b is None:
         return None
     if len(b) == 0:
         return b""   # treat empty as empty, not None
 
-    # Decode the C++ string to Python string for comparison
-    cdef str type_str = physical_type.decode("utf-8")
-    cdef str logical_str = logical_type.decode("utf-8") if logical_type.size() > 0 else ""
-
     try:
         if type_str == "int32":
             return struct.unpack("<i", b)[0]
@@ -73,102 +85,669 @@ cdef object decode_value(string physical_type, string logical_type, string raw):
         return b.hex()
 
 
-def read_metadata(str path):
-    """Read parquet metadata from a file path (delegates to buffer version)."""
+def read_metadata(str path, columns=None):
+    """
+    Read parquet metadata from a file path.
+
+    The file is memory-mapped rather than read, so only the pages holding the
+    footer are touched. Files that cannot be mapped (empty files, pipes, some
+    FUSE mounts) are read into memory instead. A mapped file must not be
+    truncated by another process while it is being read; doing so can kill
+    the process with SIGBUS.
+
+    If columns is given, only the named columns are kept in each row group;
+    the others are dropped straight after parsing and never converted.
+    """
     with open(path, "rb") as f:
-        data = f.read()
-    return read_metadata_from_bytes(data)
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return read_metadata_from_bytes(f.read(), columns)
+        with mm:
+            _advise_footer(mm)
+            return read_metadata_from_buffer(mm, columns)
+
+
+cdef _advise_footer(mm):
+    # Ask for the whole footer in one readahead rather than faulting it in a
+    # page at a time; the trailer holds its length. Purely a hint.
+    cdef Py_ssize_t size = len(mm)
+    cdef Py_ssize_t start
+    if size < 8 or not hasattr(mmap, "MADV_WILLNEED"):
+        return
+    footer_len = int.from_bytes(mm[size - 8:size - 4], "little")
+    start = max(0, size - 8 - footer_len)
+    start -= start % mmap.PAGESIZE
+    try:
+        mm.madvise(mmap.MADV_WILLNEED, start, size - start)
+    except (OSError, ValueError):
+        pass
+
+
+# bytes at the end of each file hinted by prefetch_footers
+FOOTER_PREFETCH_SIZE = 64 * 1024
+
+
+def prefetch_footers(paths):
+    """
+    Ask the kernel to start reading the footers of several files.
+
+    Issuing the hints for every file before parsing any of them lets the
+    page-ins proceed in parallel, which helps on cold caches and slow
+    storage. This is a no-op on platforms without posix_fadvise; files that
+    cannot be opened are skipped and reported by the read that follows.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            size = os.fstat(fd).st_size
+            start = max(0, size - FOOTER_PREFETCH_SIZE)
+            os.posix_fadvise(fd, start, size - start, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def read_metadata_cached(str path, cache_dir=None):
+    """
+    Read parquet metadata from a file path, reusing previously parsed results.
+
+    Results are cached in-process keyed on the file's real path, modification
+    time and size, so a file that changes on disk is parsed again. The returned
+    dictionary is shared between callers and must not be mutated.
+
+    If cache_dir is given, parsed metadata is also pickled into that directory
+    under the same key so later processes can skip parsing the footer. In
+    that case row_groups is always a plain list, whether the metadata was
+    just parsed or loaded from disk. Cache entries are loaded with pickle, so
+    cache_dir must be private to trusted users: anyone able to write to it
+    can run code in the reading process. Entries that cannot be loaded are
+    ignored and the footer is parsed again.
+    """
+    st = os.stat(path)
+    if cache_dir is not None:
+        cache_dir = os.path.expanduser(os.fspath(cache_dir))
+    return _read_metadata_cached(os.path.realpath(path), st.st_mtime_ns, st.st_size, cache_dir)
 
 
-def read_metadata_from_bytes(bytes data):
+@functools.lru_cache(maxsize=256)
+def _read_metadata_cached(str path, object mtime_ns, object size, object cache_dir):
+    if cache_dir is None:
+        return read_metadata(path)
+
+    key = hashlib.sha1(f"{path}\0{mtime_ns}\0{size}".encode("utf-8")).hexdigest()
+    cache_file = os.path.join(cache_dir, key + ".pickle")
+    try:
+        with open(cache_file, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        # unreadable, truncated or written by an incompatible version
+        cached = None
+    if isinstance(cached, dict) and "num_rows" in cached and isinstance(cached.get("row_groups"), list):
+        return cached
+
+    # the same shape the pickle round-trip produces, so cold and warm reads agree
+    metadata = read_metadata(path)
+    metadata = dict(metadata, row_groups=list(metadata["row_groups"]))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a private name first so readers never see a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(metadata, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return metadata
+
+
+def clear_metadata_cache():
+    """Discard all metadata held in-process by read_metadata_cached."""
+    _read_metadata_cached.cache_clear()
+
+
+def read_metadata_from_bytes(bytes data, columns=None):
     """Read parquet metadata from an in-memory bytes object."""
     cdef const uint8_t* buf = <const uint8_t*> data
     cdef size_t size = len(data)
-    return _read_metadata_common(buf, size)
+    return _read_metadata_common(buf, size, columns)
 
 
-def read_metadata_from_memoryview(memoryview mv):
+def read_metadata_from_memoryview(memoryview mv, columns=None):
     """Read parquet metadata from a Python memoryview (zero-copy)."""
     if not mv.contiguous:
         raise ValueError("Memoryview must be contiguous")
+    return read_metadata_from_buffer(mv, columns)
 
-    cdef memoryview[uint8_t] mv_bytes = mv.cast('B')  # keep reference alive
-    cdef const uint8_t* buf = &mv_bytes[0]
-    cdef size_t size = mv_bytes.nbytes
 
-    return _read_metadata_common(buf, size)
+def read_metadata_from_buffer(object buffer, columns=None):
+    """
+    Read parquet metadata from any object supporting the buffer protocol
+    (bytes, bytearray, memoryview, mmap, pyarrow.Buffer, ...) without copying.
+    """
+    cdef const uint8_t[::1] view = memoryview(buffer).cast("B")
+    if view.shape[0] == 0:
+        # no first element to point at; the parser reports it like any short buffer
+        return _read_metadata_common(NULL, 0, columns)
+    return _read_metadata_common(&view[0], view.shape[0], columns)
 
 
-cdef object _read_metadata_common(const uint8_t* buf, size_t size):
-    cdef metadata_reader.FileStats fs
-    fs = metadata_reader.ReadParquetMetadataFromBuffer(buf, size)
+cdef object _read_metadata_common(const uint8_t* buf, size_t size, object columns):
+    cdef RowGroups row_groups = RowGroups.__new__(RowGroups)
+    cdef unordered_set[string] keep
+    cdef bint project = columns is not None
+    if project:
+        if isinstance(columns, str):
+            raise TypeError("columns must be a collection of column names, not a str")
+        for name in columns:
+            keep.insert((<str?>name).encode("utf-8"))
+    # parsing touches no Python objects, so let other threads run meanwhile
+    with nogil:
+        row_groups._stats = metadata_reader.ReadParquetMetadataFromBuffer(buf, size)
+        if project:
+            _project_columns(row_groups._stats, keep)
+    row_groups._cache = [None] * row_groups._stats.row_groups.size()
+    row_groups._strings = {}
 
-    result = {
-        "num_rows": fs.num_rows,
-        "row_groups": []
+    return {
+        "num_rows": row_groups._stats.num_rows,
+        "row_groups": row_groups
     }
-    for rg in fs.row_groups:
-        rg_dict = {
-            "num_rows": rg.num_rows,
-            "total_byte_size": rg.total_byte_size,
-            "columns": []
-        }
-        for col in rg.columns:
-            if col.logical_type.size() > 0:
-                logical_type_str = col.logical_type.decode("utf-8")
-            else:
-                logical_type_str = ""
-
-            # Convert -1 to None for missing stats
-            null_count = col.null_count if col.null_count >= 0 else None
-            distinct_count = col.distinct_count if col.distinct_count >= 0 else None
-            num_values = col.num_values if col.num_values >= 0 else None
-            total_uncompressed_size = col.total_uncompressed_size if col.total_uncompressed_size >= 0 else None
-            total_compressed_size = col.total_compressed_size if col.total_compressed_size >= 0 else None
-            data_page_offset = col.data_page_offset if col.data_page_offset >= 0 else None
-            index_page_offset = col.index_page_offset if col.index_page_offset >= 0 else None
-            dictionary_page_offset = col.dictionary_page_offset if col.dictionary_page_offset >= 0 else None
-            bloom_offset = col.bloom_offset if col.bloom_offset >= 0 else None
-            bloom_length = col.bloom_length if col.bloom_length >= 0 else None
-
-            # Decode min/max, treating empty strings as None (no stats)
-            min_val = decode_value(col.physical_type, col.logical_type, col.min) if col.min.size() > 0 else None
-            max_val = decode_value(col.physical_type, col.logical_type, col.max) if col.max.size() > 0 else None
-
-            # Convert encodings to list of strings
-            encodings_list = []
-            for enc in col.encodings:
-                encodings_list.append(metadata_reader.EncodingToString(enc).decode("utf-8"))
-
-            # Convert codec to string
-            codec_str = None
-            if col.codec >= 0:
-                codec_str = metadata_reader.CompressionCodecToString(col.codec).decode("utf-8")
-
-            # Convert key_value_metadata to Python dict
-            kv_metadata = {}
-            for item in col.key_value_metadata:
-                kv_metadata[item.first.decode("utf-8")] = item.second.decode("utf-8")
-
-            rg_dict["columns"].append({
-                "name": col.name.decode("utf-8"),
-                "type": col.physical_type.decode("utf-8"),
-                "logical_type": logical_type_str,
-                "min": min_val,
-                "max": max_val,
-                "null_count": null_count,
-                "distinct_count": distinct_count,
-                "num_values": num_values,
-                "total_uncompressed_size": total_uncompressed_size,
-                "total_compressed_size": total_compressed_size,
-                "data_page_offset": data_page_offset,
-                "index_page_offset": index_page_offset,
-                "dictionary_page_offset": dictionary_page_offset,
-                "bloom_offset": bloom_offset,
-                "bloom_length": bloom_length,
-                "encodings": encodings_list,
-                "compression_codec": codec_str,
-                "key_value_metadata": kv_metadata if kv_metadata else None,
-            })
-        result["row_groups"].append(rg_dict)
+
+
+cdef void _project_columns(metadata_reader.FileStats& stats, const unordered_set[string]& keep) noexcept nogil:
+    # compact each row group's columns in place, keeping file order
+    cdef vector[metadata_reader.ColumnStats]* cols
+    cdef size_t i, j, k
+    for i in range(stats.row_groups.size()):
+        cols = &stats.row_groups[i].columns
+        k = 0
+        for j in range(cols.size()):
+            if keep.count(deref(cols)[j].name):
+                if k != j:
+                    deref(cols)[k] = move(deref(cols)[j])
+                k += 1
+        cols.resize(k)
+
+
+# Names, types and enum strings repeat across every row group; each distinct
+# value is kept once rather than allocated per column per row group. Enum
+# names are a small fixed set and shared process-wide; names and types are
+# shared through a dict owned by each RowGroups, so they are freed with it
+cdef dict _ENCODING_NAMES = {}
+cdef dict _CODEC_NAMES = {}
+
+
+cdef inline str _shared_str(dict strings, const string& s):
+    text = s.decode("utf-8")
+    return strings.setdefault(text, text)
+
+
+cdef str _encoding_name(int32_t enc):
+    name = _ENCODING_NAMES.get(enc)
+    if name is None:
+        name = _ENCODING_NAMES[enc] = metadata_reader.EncodingToString(enc).decode("utf-8")
+    return name
+
+
+cdef str _codec_name(int32_t codec):
+    name = _CODEC_NAMES.get(codec)
+    if name is None:
+        name = _CODEC_NAMES[codec] = metadata_reader.CompressionCodecToString(codec).decode("utf-8")
+    return name
+
+
+cdef dict _row_group_to_dict(metadata_reader.RowGroupStats& rg, dict strings):
+    cdef metadata_reader.ColumnStats* col
+    cdef size_t j
+    rg_dict = {
+        "num_rows": rg.num_rows,
+        "total_byte_size": rg.total_byte_size,
+        "columns": []
+    }
+    for j in range(rg.columns.size()):
+        # by pointer, so the C++ column stats are not copied
+        col = &rg.columns[j]
+        type_str = _shared_str(strings, col.physical_type)
+        if col.logical_type.size() > 0:
+            logical_type_str = _shared_str(strings, col.logical_type)
+        else:
+            logical_type_str = ""
+
+        # Convert -1 to None for missing stats
+        null_count = col.null_count if col.null_count >= 0 else None
+        distinct_count = col.distinct_count if col.distinct_count >= 0 else None
+        num_values = col.num_values if col.num_values >= 0 else None
+        total_uncompressed_size = col.total_uncompressed_size if col.total_uncompressed_size >= 0 else None
+        total_compressed_size = col.total_compressed_size if col.total_compressed_size >= 0 else None
+        data_page_offset = col.data_page_offset if col.data_page_offset >= 0 else None
+        index_page_offset = col.index_page_offset if col.index_page_offset >= 0 else None
+        dictionary_page_offset = col.dictionary_page_offset if col.dictionary_page_offset >= 0 else None
+        bloom_offset = col.bloom_offset if col.bloom_offset >= 0 else None
+        bloom_length = col.bloom_length if col.bloom_length >= 0 else None
+
+        # Decode min/max, treating empty strings as None (no stats)
+        min_val = decode_value(type_str, logical_type_str, col.min) if col.min.size() > 0 else None
+        max_val = decode_value(type_str, logical_type_str, col.max) if col.max.size() > 0 else None
+
+        # Convert encodings to list of strings
+        encodings_list = []
+        for enc in col.encodings:
+            encodings_list.append(_encoding_name(enc))
+
+        # Convert codec to string
+        codec_str = None
+        if col.codec >= 0:
+            codec_str = _codec_name(col.codec)
+
+        # Convert key_value_metadata to Python dict
+        kv_metadata = {}
+        for item in col.key_value_metadata:
+            kv_metadata[item.first.decode("utf-8")] = item.second.decode("utf-8")
+
+        rg_dict["columns"].append({
+            "name": _shared_str(strings, col.name),
+            "type": type_str,
+            "logical_type": logical_type_str,
+            "min": min_val,
+            "max": max_val,
+            "min_max_v2": col.min_max_v2,
+            "null_count": null_count,
+            "distinct_count": distinct_count,
+            "num_values": num_values,
+            "total_uncompressed_size": total_uncompressed_size,
+            "total_compressed_size": total_compressed_size,
+            "data_page_offset": data_page_offset,
+            "index_page_offset": index_page_offset,
+            "dictionary_page_offset": dictionary_page_offset,
+            "bloom_offset": bloom_offset,
+            "bloom_length": bloom_length,
+            "encodings": encodings_list,
+            "compression_codec": codec_str,
+            "key_value_metadata": kv_metadata if kv_metadata else None,
+        })
+    return rg_dict
+
+
+@cython.final
+@cython.freelist(16)
+cdef class ColumnDescriptor:
+    """
+    Read-only summary of one column chunk, with attribute access.
+
+    Missing values are None, as in the column dictionaries.
+    """
+    cdef readonly str name
+    cdef readonly str type
+    cdef readonly str logical_type
+    cdef readonly object num_values
+    cdef readonly object null_count
+    cdef readonly object bloom_offset
+    cdef readonly object bloom_length
+
+    def __repr__(self):
+        return f"ColumnDescriptor(name={self.name!r}, type={self.type!r}, logical_type={self.logical_type!r})"
+
+
+cdef ColumnDescriptor _column_descriptor(metadata_reader.ColumnStats& col):
+    cdef ColumnDescriptor descriptor = ColumnDescriptor.__new__(ColumnDescriptor)
+    descriptor.name = col.name.decode("utf-8")
+    descriptor.type = col.physical_type.decode("utf-8")
+    descriptor.logical_type = col.logical_type.decode("utf-8")
+    descriptor.num_values = col.num_values if col.num_values >= 0 else None
+    descriptor.null_count = col.null_count if col.null_count >= 0 else None
+    descriptor.bloom_offset = col.bloom_offset if col.bloom_offset >= 0 else None
+    descriptor.bloom_length = col.bloom_length if col.bloom_length >= 0 else None
+    return descriptor
+
+
+def iter_columns(str path, Py_ssize_t row_group=0):
+    """
+    Iterate over the columns of one row group as ColumnDescriptor objects.
+
+    This skips building the full metadata dictionaries, which suits simple
+    introspection of names and types.
+    """
+    cdef RowGroups row_groups = read_metadata(path)["row_groups"]
+    return row_groups.iter_columns(row_group)
+
+
+@cython.final
+cdef class RowGroups:
+    """
+    Read-only sequence of row group dictionaries.
+
+    The footer is parsed up front, but each row group's dictionary is only
+    built the first time it is accessed, so callers that look at a few row
+    groups of a large file do not pay for the rest. Use list() to get a plain
+    list of every row group.
+    """
+    cdef metadata_reader.FileStats _stats
+    cdef list _cache
+    cdef dict _strings
+
+    def __len__(self):
+        return self._stats.row_groups.size()
+
+    cdef Py_ssize_t _position(self, Py_ssize_t i) except -1:
+        cdef Py_ssize_t n = self._stats.row_groups.size()
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("row group index out of range")
+        return i
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[j] for j in range(*index.indices(len(self)))]
+        cdef Py_ssize_t i = self._position(index)
+        rg = self._cache[i]
+        if rg is None:
+            rg = _row_group_to_dict(self._stats.row_groups[i], self._strings)
+            self._cache[i] = rg
+        return rg
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    # registering with Sequence adds no mixin methods, so these are spelled out
+    def index(self, value, start=0, stop=None):
+        """Return the first index of value; raise ValueError if it is not present."""
+        for i in range(*slice(start, stop).indices(len(self))):
+            rg = self[i]
+            if rg is value or rg == value:
+                return i
+        raise ValueError("value is not in row_groups")
+
+    def count(self, value):
+        """Return the number of row groups equal to value."""
+        return sum(1 for rg in self if rg is value or rg == value)
+
+    def iter_columns(self, index):
+        """Iterate over the columns of a row group as ColumnDescriptor objects."""
+        # validate the index now rather than on the first next()
+        return self._iter_columns(self._position(index))
+
+    def _iter_columns(self, Py_ssize_t i):
+        cdef Py_ssize_t j
+        for j in range(self._stats.row_groups[i].columns.size()):
+            yield _column_descriptor(self._stats.row_groups[i].columns[j])
+
+    cdef void _bloom_locations(self, const string& name, vector[int64_t]& offsets, vector[int64_t]& lengths):
+        # the bloom filter of the named column in each row group, -1 if absent
+        cdef size_t i, j
+        cdef int64_t offset, length
+        for i in range(self._stats.row_groups.size()):
+            offset = length = -1
+            for j in range(self._stats.row_groups[i].columns.size()):
+                if self._stats.row_groups[i].columns[j].name == name:
+                    offset = self._stats.row_groups[i].columns[j].bloom_offset
+                    length = self._stats.row_groups[i].columns[j].bloom_length
+                    break
+            offsets.push_back(offset)
+            lengths.push_back(length)
+
+    def columns_soa(self, index):
+        """
+        Return the columns of a row group as parallel arrays.
+
+        Each field is a separate list or array indexed by column position,
+        built directly from the parsed footer without creating per-column
+        dictionaries. Missing offsets and counts are -1 rather than None.
+        """
+        cdef Py_ssize_t i = self._position(index)
+        cdef metadata_reader.RowGroupStats* rg = &self._stats.row_groups[i]
+        cdef metadata_reader.ColumnStats* col
+        cdef Py_ssize_t n = rg.columns.size()
+        cdef Py_ssize_t j
+        cdef array.array null_counts = array.clone(_INT64_ARRAY, n, zero=False)
+        cdef array.array bloom_offsets = array.clone(_INT64_ARRAY, n, zero=False)
+        cdef array.array bloom_lengths = array.clone(_INT64_ARRAY, n, zero=False)
+        names = [None] * n
+        types = [None] * n
+        logical_types = [None] * n
+
+        for j in range(n):
+            col = &rg.columns[j]
+            names[j] = col.name.decode("utf-8")
+            types[j] = col.physical_type.decode("utf-8")
+            logical_types[j] = col.logical_type.decode("utf-8")
+            null_counts.data.as_longlongs[j] = col.null_count
+            bloom_offsets.data.as_longlongs[j] = col.bloom_offset
+            bloom_lengths.data.as_longlongs[j] = col.bloom_length
+
+        return ColumnArrays(names, types, logical_types, null_counts, bloom_offsets, bloom_lengths)
+
+    def __eq__(self, other):
+        if isinstance(other, (RowGroups, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+Sequence.register(RowGroups)
+
+ColumnArrays = namedtuple(
+    "ColumnArrays",
+    ["names", "types", "logical_types", "null_counts", "bloom_offsets", "bloom_lengths"],
+)
+
+cdef array.array _INT64_ARRAY = array.array("q")
+
+
+# --- bloom filters ---
+cdef string _bloom_key(object value) except *:
+    # Bloom filters hash the plain encoding, which for strings is the UTF-8 bytes
+    if isinstance(value, str):
+        return (<str> value).encode("utf-8")
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    raise TypeError(f"Bloom filter values must be str or bytes, not {type(value).__name__}")
+
+
+def has_bloom_filter(dict column):
+    """Return True if the column metadata records a bloom filter."""
+    return column.get("bloom_offset") is not None
+
+
+def test_bloom_filter(str file_path, object bloom_offset, object bloom_length, object value):
+    """
+    Test whether a value might be present in a column chunk's bloom filter.
+
+    False means the value is definitely not in the column chunk; True means it
+    might be. bloom_offset and bloom_length are taken from the column metadata,
+    bloom_length may be None.
+    """
+    cdef int64_t offset = bloom_offset
+    cdef int64_t length = -1 if bloom_length is None else bloom_length
+    cdef string path = file_path.encode("utf-8")
+    cdef string key = _bloom_key(value)
+    cdef bint result
+    with nogil:
+        result = metadata_reader.TestBloomFilter(path, offset, length, key)
     return result
+
+
+def test_bloom_filter_batch(str file_path, object bloom_offset, object bloom_length, list values):
+    """
+    Test several values against one bloom filter, reading the filter once.
+
+    Returns a list of booleans in the same order as values. The GIL is
+    released while the filter is read and probed.
+    """
+    cdef int64_t offset = bloom_offset
+    cdef int64_t length = -1 if bloom_length is None else bloom_length
+    cdef string path = file_path.encode("utf-8")
+    cdef vector[string] keys
+    cdef vector[uint8_t] results
+    keys.reserve(len(values))
+    for value in values:
+        keys.push_back(_bloom_key(value))
+    with nogil:
+        results = metadata_reader.TestBloomFilterBatch(path, offset, length, keys)
+    return [r != 0 for r in results]
+
+
+def column_may_contain(str file_path, dict column, list values):
+    """
+    Test values against a column chunk using its statistics and bloom filter.
+
+    Statistics are checked first: a chunk without non-null values cannot hold
+    anything, and a byte array chunk whose min equals its max holds only that
+    value, so neither needs the bloom filter read. Remaining values are probed in one
+    batch when the chunk has a bloom filter and are otherwise reported as
+    possibly present. Returns a list of booleans in the same order as values.
+    """
+    num_values = column.get("num_values")
+    null_count = column.get("null_count") or 0
+    if num_values is not None and num_values <= null_count:
+        return [False] * len(values)
+
+    # only byte arrays decode min/max to their plain encoding; int96 and the
+    # hex fallback also give str, which would not match the raw value
+    min_value = column.get("min")
+    if (
+        column.get("type") in ("byte_array", "fixed_len_byte_array")
+        and isinstance(min_value, (str, bytes))
+        and min_value == column.get("max")
+    ):
+        only = _bloom_key(min_value)
+        return [_bloom_key(value) == only for value in values]
+
+    if not has_bloom_filter(column):
+        return [True] * len(values)
+    return test_bloom_filter_batch(file_path, column["bloom_offset"], column["bloom_length"], values)
+
+
+BloomProbe = namedtuple("BloomProbe", ["might_exist", "row_groups"])
+
+
+def probe_bloom(str file_path, object row_groups, str column, object value):
+    """
+    Test a value against one column's bloom filter in every row group.
+
+    The file is opened and the value hashed once for all row groups. Returns a
+    BloomProbe whose row_groups field holds one boolean per row group and whose
+    might_exist is True if any of them might hold the value. Row groups
+    without a bloom filter for the column always report True.
+    """
+    cdef vector[int64_t] offsets
+    cdef vector[int64_t] lengths
+    cdef vector[uint8_t] results
+    cdef string path = file_path.encode("utf-8")
+    cdef string key = _bloom_key(value)
+
+    if isinstance(row_groups, RowGroups):
+        (<RowGroups> row_groups)._bloom_locations(column.encode("utf-8"), offsets, lengths)
+    else:
+        for rg in row_groups:
+            offset = length = None
+            for col in rg["columns"]:
+                if col["name"] == column:
+                    offset = col["bloom_offset"]
+                    length = col["bloom_length"]
+                    break
+            offsets.push_back(-1 if offset is None else offset)
+            lengths.push_back(-1 if length is None else length)
+
+    with nogil:
+        results = metadata_reader.TestBloomFilterColumn(path, offsets, lengths, key)
+    per_row_group = [r != 0 for r in results]
+    return BloomProbe(any(per_row_group), per_row_group)
+
+
+# --- row group pruning ---
+_PRUNE_OPERATORS = frozenset(("=", "==", "!=", "<", "<=", ">", ">="))
+
+
+# logical types whose min/max decode to values comparable with the column's
+# own values; anything else (decimals, dates, timestamps, unsigned ints, ...)
+# decodes to raw physical values and must never be used to skip
+_STATS_VALUE_TYPES = frozenset(("", "varchar", "UTF8", "float32", "float64", "boolean", "binary"))
+
+
+cdef bint _stats_in_value_domain(dict col):
+    physical = col.get("type")
+    if physical == "int96":
+        return False
+    # the deprecated min/max fields order byte arrays as signed bytes in files
+    # from older writers, so only min_value/max_value can rule anything out
+    if physical in ("byte_array", "fixed_len_byte_array") and not col.get("min_max_v2"):
+        return False
+    logical = col.get("logical_type") or ""
+    if logical in _STATS_VALUE_TYPES:
+        return True
+    if logical.startswith("INT_"):
+        logical = "int" + logical[4:]
+    # signed intN only; uintN starts with "u"
+    return logical.startswith("int") and logical[3:].isdigit()
+
+
+cdef bint _can_skip(dict col, str op, object value) except -1:
+    # True only when the statistics prove no row in the chunk satisfies
+    # "column op value"; missing or incomparable statistics never skip
+    num_values = col.get("num_values")
+    if num_values is not None and num_values <= (col.get("null_count") or 0):
+        return True  # nulls never satisfy a comparison
+
+    if not _stats_in_value_domain(col):
+        return False
+
+    low = col.get("min")
+    high = col.get("max")
+    try:
+        if op in ("=", "=="):
+            return (low is not None and value < low) or (high is not None and value > high)
+        if op == "!=":
+            return low is not None and low == high == value
+        if op == "<":
+            return low is not None and low >= value
+        if op == "<=":
+            return low is not None and low > value
+        if op == ">":
+            return high is not None and high <= value
+        if op == ">=":
+            return high is not None and high < value
+    except TypeError:
+        pass
+    return False
+
+
+def prune_row_groups(str file_path, object row_groups, str column, str op, object value):
+    """
+    Return the indexes of the row groups that might satisfy "column op value".
+
+    op is one of =, ==, !=, <, <=, > or >=. Row groups are skipped when the
+    column's min/max statistics rule the predicate out; for equality on str or
+    bytes values the surviving row groups are then checked against their bloom
+    filters in a single pass. Row groups without usable statistics are kept.
+    """
+    if op not in _PRUNE_OPERATORS:
+        raise ValueError(f"Unsupported comparison operator: {op!r}")
+
+    survivors = []
+    for index, rg in enumerate(row_groups):
+        col = None
+        for candidate in rg["columns"]:
+            if candidate["name"] == column:
+                col = candidate
+                break
+        if col is None or not _can_skip(col, op, value):
+            survivors.append(index)
+
+    if op in ("=", "==") and isinstance(value, (str, bytes, bytearray)) and survivors:
+        probe = probe_bloom(file_path, [row_groups[i] for i in survivors], column, value)
+        survivors = [i for i, hit in zip(survivors, probe.row_groups) if hit]
+    return survivors
@@ -34,7 +34,7 @@ enum ThriftType {
 
 // ------------------- Varint / ZigZag -------------------
 
-inline uint64_t ReadVarint(TInput &in) {
+inline uint64_t ReadVarintSlow(TInput &in) {
   uint64_t result = 0;
   int shift = 0;
   int count = 0;
@@ -52,6 +52,13 @@ inline uint64_t ReadVarint(TInput &in) {
   return result;
 }
 
+// Field ids, list sizes and most counts in a footer fit in a single byte.
+inline uint64_t ReadVarint(TInput &in) {
+  if (in.p < in.end && !(*in.p & 0x80))
+    return *in.p++;
+  return ReadVarintSlow(in);
+}
+
 inline int64_t ZigZagDecode(uint64_t n) { return (n >> 1) ^ -(int64_t)(n & 1); }
 
 inline int64_t ReadI64(TInput &in) { return ZigZagDecode(ReadVarint(in)); }
@@ -3,11 +3,30 @@
 Setup script for rugo - A Cython-based file decoders library
 """
 
+import os
+import platform
+
 from Cython.Build import cythonize
 from setuptools import Extension
 from setuptools import setup
 
 
+def get_compile_args():
+    """Compiler flags, tuned for the build machine when RUGO_NATIVE=1"""
+    args = ["-O3", "-std=c++17", "-funroll-loops"]
+
+    # Released wheels must run on any CPU of their architecture; SIMD paths
+    # are selected at runtime instead. Local builds can opt in to the host's
+    # full instruction set.
+    if os.environ.get("RUGO_NATIVE") == "1":
+        if platform.machine().lower() in ("x86_64", "amd64", "i386", "i686"):
+            args.append("-march=native")
+        else:
+            args.append("-mcpu=native")
+
+    return args
+
+
 def get_extensions():
     """Define the Cython extensions to build"""
     extensions = []
@@ -18,7 +37,7 @@ def get_extensions():
         sources=["rugo/parquet/metadata_reader.pyx", "rugo/parquet/metadata.cpp"],
         include_dirs=[],
         language="c++",
-        extra_compile_args=["-O3", "-std=c++17"],
+        extra_compile_args=get_compile_args(),
         extra_link_args=[],
     )
     extensions.append(parquet_ext)
@@ -39,8 +58,11 @@ def main():
             "wraparound": False,
             "initializedcheck": False,
             "cdivision": True,
+            "profile": False,
+            "linetrace": False,
         },
-        annotate=True,  # Generate HTML annotation files for debugging
+        # HTML annotation files are only useful when debugging, RUGO_ANNOTATE=1
+        annotate=os.environ.get("RUGO_ANNOTATE") == "1",
     )
     
     # Setup configuration
@@ -4,16 +4,21 @@ Test that all metadata fields from the C++ ColumnStats struct are exposed to Pyt
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import rugo.parquet as parquet_meta
 
 
-def test_all_metadata_fields_exposed():
+@pytest.fixture(scope="module")
+def metadata():
+    """planets.parquet metadata, parsed once and shared by the read-only tests."""
+    return parquet_meta.read_metadata('tests/data/planets.parquet')
+
+
+def test_all_metadata_fields_exposed(metadata):
     """Test that all C++ ColumnStats fields are exposed in the Python dictionary."""
-    # Read a test file
-    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
-    
     # Get first column metadata
     assert metadata['row_groups'], "No row groups found"
     assert metadata['row_groups'][0]['columns'], "No columns found"
@@ -39,6 +44,7 @@ def test_all_metadata_fields_exposed():
         # Statistics
         'min',
         'max',
+        'min_max_v2',
         'null_count',
         'distinct_count',
         
@@ -65,9 +71,8 @@ def test_all_metadata_fields_exposed():
     print(f"✅ All {len(expected_fields)} expected fields are present in column metadata")
 
 
-def test_metadata_field_types():
+def test_metadata_field_types(metadata):
     """Test that metadata fields have the correct types."""
-    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
     col = metadata['row_groups'][0]['columns'][0]
     
     # Check types
@@ -100,9 +105,8 @@ def test_metadata_field_types():
     print("✅ All field types are correct")
 
 
-def test_metadata_field_values():
+def test_metadata_field_values(metadata):
     """Test that metadata field values are reasonable."""
-    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
     col = metadata['row_groups'][0]['columns'][0]
     
     # Basic fields should be present
@@ -144,10 +148,8 @@ def test_metadata_field_values():
     print(f"   - Codec: {col['compression_codec']}")
 
 
-def test_multiple_columns():
+def test_multiple_columns(metadata):
     """Test that all columns have the complete metadata."""
-    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
-    
     expected_fields = {
         'name', 'type', 'logical_type', 'num_values', 'total_uncompressed_size',
         'total_compressed_size', 'data_page_offset', 'index_page_offset',
@@ -165,8 +167,4 @@ def test_multiple_columns():
 
 
 if __name__ == "__main__":
-    test_all_metadata_fields_exposed()
-    test_metadata_field_types()
-    test_metadata_field_values()
-    test_multiple_columns()
-    print("\n✅ All tests passed!")
+    pytest.main([__file__])
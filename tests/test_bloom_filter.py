@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for bloom filter testing against parquet column chunks.
+"""
+
+import datetime
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+import rugo.parquet as parquet_meta
+
+BLOOM_FILE = 'tests/data/data_index_bloom_encoding_stats.parquet'
+
+# every value stored in the 'String' column of BLOOM_FILE
+BLOOM_VALUES = [
+    'Hello', 'This is', 'a', 'test', 'How', 'are you', 'doing ', 'today',
+    'the quick', 'brown fox', 'jumps', 'over', 'the lazy', 'dog',
+]
+
+
+def _bloom_column(file_path):
+    meta = parquet_meta.read_metadata(file_path)
+    for col in meta['row_groups'][0]['columns']:
+        if parquet_meta.has_bloom_filter(col):
+            return col
+    return None
+
+
+def test_has_bloom_filter():
+    """Only columns with a bloom offset report a bloom filter"""
+    col = _bloom_column(BLOOM_FILE)
+    assert col is not None
+    assert col['name'] == 'String'
+
+    meta = parquet_meta.read_metadata('tests/data/planets.parquet')
+    assert not any(parquet_meta.has_bloom_filter(c) for c in meta['row_groups'][0]['columns'])
+
+
+def test_bloom_filter_present_values():
+    """Values stored in the column are always reported as possibly present"""
+    col = _bloom_column(BLOOM_FILE)
+    for value in BLOOM_VALUES:
+        assert parquet_meta.test_bloom_filter(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], value)
+
+
+def test_bloom_filter_absent_values():
+    """Values not in the column are rejected (allowing for false positives)"""
+    col = _bloom_column(BLOOM_FILE)
+    absent = [f'missing-{i}' for i in range(100)]
+    hits = sum(
+        parquet_meta.test_bloom_filter(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], value)
+        for value in absent
+    )
+    assert hits < 10
+
+
+def test_bloom_filter_batch():
+    """The batch call agrees with probing values one at a time"""
+    col = _bloom_column(BLOOM_FILE)
+    values = BLOOM_VALUES + [f'missing-{i}' for i in range(20)] + [b'Hello']
+
+    results = parquet_meta.test_bloom_filter_batch(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], values)
+    expected = [
+        parquet_meta.test_bloom_filter(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], value)
+        for value in values
+    ]
+
+    assert results == expected
+    assert all(results[:len(BLOOM_VALUES)])
+    assert results[-1] is True
+    assert parquet_meta.test_bloom_filter_batch(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], []) == []
+
+
+def test_bloom_filter_long_values(tmp_path):
+    """Values longer than one 32-byte hash stripe hash correctly"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    values = [f'value-{i}-' + 'x' * (i % 70) for i in range(200)]
+    file_path = str(tmp_path / 'bloom.parquet')
+    try:
+        pq.write_table(pa.table({'s': values}), file_path, bloom_filter_options={'s': {'ndv': 200}})
+    except TypeError:
+        pytest.skip("pyarrow does not support writing bloom filters")
+
+    col = _bloom_column(file_path)
+    assert col is not None
+    assert all(parquet_meta.test_bloom_filter_batch(file_path, col['bloom_offset'], col['bloom_length'], values))
+
+    # with bloom_length the filter is read in one go, without it in two reads
+    probes = values[:20] + [f'missing-{i}' for i in range(20)]
+    assert col['bloom_length'] is not None
+    assert parquet_meta.test_bloom_filter_batch(file_path, col['bloom_offset'], col['bloom_length'], probes) == \
+        parquet_meta.test_bloom_filter_batch(file_path, col['bloom_offset'], None, probes)
+
+
+def test_probe_bloom_across_row_groups(tmp_path):
+    """One probe reports per row group and agrees with testing each filter"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    values = [f'value-{i}' for i in range(300)]
+    file_path = str(tmp_path / 'bloom.parquet')
+    try:
+        pq.write_table(pa.table({'s': values}), file_path, row_group_size=100,
+                       bloom_filter_options={'s': {'ndv': 100}})
+    except TypeError:
+        pytest.skip("pyarrow does not support writing bloom filters")
+
+    row_groups = parquet_meta.read_metadata(file_path)['row_groups']
+    assert len(row_groups) == 3
+
+    probe = parquet_meta.probe_bloom(file_path, row_groups, 's', 'value-150')
+    assert probe.might_exist
+    assert probe.row_groups[1]
+
+    for value in ['value-5', 'value-250', 'missing']:
+        expected = [
+            parquet_meta.test_bloom_filter(file_path, rg['columns'][0]['bloom_offset'],
+                                           rg['columns'][0]['bloom_length'], value)
+            for rg in row_groups
+        ]
+        assert parquet_meta.probe_bloom(file_path, row_groups, 's', value).row_groups == expected
+        assert parquet_meta.probe_bloom(file_path, list(row_groups), 's', value).row_groups == expected
+
+    # a column without bloom filters cannot rule anything out
+    assert parquet_meta.probe_bloom(file_path, row_groups, 'other', 'x') == (True, [True, True, True])
+
+
+def test_bloom_filter_invalid_value():
+    """Only str and bytes values can be tested"""
+    col = _bloom_column(BLOOM_FILE)
+    with pytest.raises(TypeError):
+        parquet_meta.test_bloom_filter(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], 42)
+
+
+def test_bloom_filter_missing_file():
+    """Errors raised while the GIL is released still surface as exceptions"""
+    col = _bloom_column(BLOOM_FILE)
+    missing = 'tests/data/does-not-exist.parquet'
+    with pytest.raises(RuntimeError, match="Unable to open file"):
+        parquet_meta.test_bloom_filter(missing, col['bloom_offset'], col['bloom_length'], 'Hello')
+    with pytest.raises(RuntimeError, match="Unable to open file"):
+        parquet_meta.test_bloom_filter_batch(missing, col['bloom_offset'], col['bloom_length'], ['Hello'])
+
+
+def test_column_may_contain():
+    """Statistics answer constant and empty chunks without reading the filter"""
+    col = _bloom_column(BLOOM_FILE)
+    values = BLOOM_VALUES + ['missing-1']
+    assert parquet_meta.column_may_contain(BLOOM_FILE, col, values) == \
+        parquet_meta.test_bloom_filter_batch(BLOOM_FILE, col['bloom_offset'], col['bloom_length'], values)
+
+    # the path does not exist, so any bloom filter read would raise
+    missing = 'tests/data/does-not-exist.parquet'
+    constant = dict(col, min='dog', max='dog')
+    assert parquet_meta.column_may_contain(missing, constant, ['dog', b'dog', 'cat']) == [True, True, False]
+
+    empty = dict(col, num_values=3, null_count=3)
+    assert parquet_meta.column_may_contain(missing, empty, ['dog']) == [False]
+
+    no_bloom = dict(col, bloom_offset=None, bloom_length=None)
+    assert parquet_meta.column_may_contain(missing, no_bloom, ['dog']) == [True]
+
+
+def test_column_may_contain_int96(tmp_path):
+    """Decoded int96 statistics are not the plain value, so the filter decides"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    moment = datetime.datetime(2020, 1, 1, 12)
+    file_path = str(tmp_path / 'int96.parquet')
+    try:
+        pq.write_table(pa.table({'ts': pa.array([moment], pa.timestamp('ns'))}), file_path,
+                       use_deprecated_int96_timestamps=True, bloom_filter_options={'ts': {'ndv': 10}})
+    except TypeError:
+        pytest.skip("pyarrow does not support writing bloom filters")
+
+    col = _bloom_column(file_path)
+    if col is None:
+        pytest.skip("pyarrow did not write a bloom filter for int96")
+    assert col['type'] == 'int96'
+
+    # int96 is nanoseconds of the day then the Julian day, little-endian
+    raw = struct.pack('<qi', 12 * 3600 * 10**9, 2458850)
+    assert parquet_meta.test_bloom_filter(file_path, col['bloom_offset'], col['bloom_length'], raw)
+
+    # min == max as rugo decodes it: a formatted str rather than the 12 bytes
+    constant = dict(col, min='2020-01-01 43200:0.000000', max='2020-01-01 43200:0.000000')
+    assert parquet_meta.column_may_contain(file_path, constant, [raw]) == [True]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
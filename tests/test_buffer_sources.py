@@ -0,0 +1,86 @@
+"""
+Tests for reading parquet metadata from in-memory buffers.
+"""
+import mmap
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rugo.parquet as parquet_meta
+
+PLANETS = 'tests/data/planets.parquet'
+
+
+@pytest.mark.parametrize("reader, wrap", [
+    (parquet_meta.read_metadata_from_buffer, bytes),
+    (parquet_meta.read_metadata_from_buffer, bytearray),
+    (parquet_meta.read_metadata_from_buffer, memoryview),
+    (parquet_meta.read_metadata_from_bytes, bytes),
+    (parquet_meta.read_metadata_from_memoryview, memoryview),
+])
+def test_buffer_matches_path(reader, wrap):
+    """Every buffer type yields the same metadata as reading by path."""
+    expected = parquet_meta.read_metadata(PLANETS)
+
+    assert reader(wrap(Path(PLANETS).read_bytes())) == expected
+
+
+def test_buffer_from_mmap():
+    """An mmap can be passed directly and closed afterwards."""
+    with open(PLANETS, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            metadata = parquet_meta.read_metadata_from_buffer(mm)
+
+    assert metadata['num_rows'] == 9
+
+
+def test_buffer_from_arrow_memory_map():
+    """An Arrow memory-mapped buffer is read without copying into bytes."""
+    pa = pytest.importorskip("pyarrow")
+
+    with pa.memory_map(PLANETS, 'r') as source:
+        metadata = parquet_meta.read_metadata_from_buffer(source.read_buffer())
+
+    assert metadata == parquet_meta.read_metadata(PLANETS)
+
+
+def test_unmappable_files_are_read(tmp_path):
+    """Paths that cannot be memory-mapped fall back to reading the file."""
+    empty = tmp_path / 'empty.parquet'
+    empty.touch()
+    with pytest.raises(RuntimeError, match="Buffer too small"):
+        parquet_meta.read_metadata(str(empty))
+
+    if not os.path.isdir('/dev/fd'):
+        pytest.skip("no /dev/fd to expose a pipe as a path")
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, Path(PLANETS).read_bytes())
+        os.close(write_fd)
+        assert parquet_meta.read_metadata(f'/dev/fd/{read_fd}') == parquet_meta.read_metadata(PLANETS)
+    finally:
+        os.close(read_fd)
+
+
+def test_invalid_buffer_raises():
+    """Data that is not a parquet file raises instead of aborting."""
+    with pytest.raises(RuntimeError, match="Not a parquet file"):
+        parquet_meta.read_metadata_from_buffer(b'x' * 32)
+
+    with pytest.raises(RuntimeError, match="Buffer too small"):
+        parquet_meta.read_metadata_from_buffer(b'PAR1')
+
+    # empty input fails the same way through every entry point
+    for read in (parquet_meta.read_metadata_from_buffer, parquet_meta.read_metadata_from_bytes):
+        with pytest.raises(RuntimeError, match="Buffer too small"):
+            read(b'')
+    with pytest.raises(RuntimeError, match="Buffer too small"):
+        parquet_meta.read_metadata_from_memoryview(memoryview(b''))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -50,15 +50,14 @@ def test_logical_types():
             
         print(f"\nFile: {file_path}")
 
-        meta = parquet_meta.read_metadata(file_path)
-        
-        for rg_idx, rg in enumerate(meta['row_groups']):
-            print(f"  Row Group {rg_idx}:")
-            for col in rg['columns']:
-                if "." not in col["name"]:
-                    logical = col.get('logical_type', '')
-                    print(f"    {col['name']:20} | physical={col['type']:12} | logical={logical or '(none)'}")
-            break  # Only show first row group
+        # Only show first row group
+        lines = ["  Row Group 0:"]
+        lines.extend(
+            f"    {col.name:20} | physical={col.type:12} | logical={col.logical_type or '(none)'}"
+            for col in parquet_meta.iter_columns(file_path)
+            if "." not in col.name
+        )
+        print("\n".join(lines))
             
 
 def test_comparison_with_pyarrow():
@@ -84,12 +83,14 @@ def test_comparison_with_pyarrow():
         # Our interpretation
         meta = parquet_meta.read_metadata(file_path)
         print(f" Our interpretation: {[n['name'] for n in meta['row_groups'][0]['columns']]}")
-        print("   schema:")
+        lines = ["   schema:"]
         for col in meta['row_groups'][0]['columns']:
             if "." not in col["name"]:
                 logical = col.get('logical_type', '')
-                print(f"    {col['name']:20} | physical={col['type']:17} | logical={logical or '(none)':<17}  | arrow={arrow_types.get(col['name'], '(missing)')}")
-                assert arrow_types.get(col['name']) in EQUIVALENT_TYPES.get(logical, []), col['name']
+                arrow_type = arrow_types.get(col['name'])
+                lines.append(f"    {col['name']:20} | physical={col['type']:17} | logical={logical or '(none)':<17}  | arrow={arrow_type or '(missing)'}")
+                assert arrow_type in EQUIVALENT_TYPES.get(logical, []), col['name']
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+"""
+Tests for the in-process parquet metadata cache.
+"""
+import os
+import pickle
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rugo.parquet as parquet_meta
+
+
+def test_cached_matches_uncached():
+    """The cached reader returns the same metadata as read_metadata."""
+    parquet_meta.clear_metadata_cache()
+    path = 'tests/data/planets.parquet'
+
+    assert parquet_meta.read_metadata_cached(path) == parquet_meta.read_metadata(path)
+
+
+def test_cache_reuses_result():
+    """Repeated reads of an unchanged file return the same object."""
+    parquet_meta.clear_metadata_cache()
+    path = 'tests/data/planets.parquet'
+
+    first = parquet_meta.read_metadata_cached(path)
+    second = parquet_meta.read_metadata_cached(os.path.abspath(path))
+
+    assert first is second
+
+
+def test_cache_invalidated_on_change(tmp_path):
+    """Replacing the file on disk causes it to be parsed again."""
+    parquet_meta.clear_metadata_cache()
+    target = tmp_path / 'data.parquet'
+
+    shutil.copy('tests/data/planets.parquet', target)
+    first = parquet_meta.read_metadata_cached(str(target))
+    assert first['num_rows'] == 9
+
+    shutil.copy('tests/data/satellites.parquet', target)
+    second = parquet_meta.read_metadata_cached(str(target))
+
+    assert second is not first
+    assert second['num_rows'] == parquet_meta.read_metadata('tests/data/satellites.parquet')['num_rows']
+
+
+def test_clear_metadata_cache():
+    """Clearing the cache forces a fresh parse."""
+    path = 'tests/data/planets.parquet'
+
+    first = parquet_meta.read_metadata_cached(path)
+    parquet_meta.clear_metadata_cache()
+    second = parquet_meta.read_metadata_cached(path)
+
+    assert first is not second
+    assert first == second
+
+
+def test_disk_cache_shared_between_processes(tmp_path):
+    """Metadata persisted with cache_dir is loaded instead of re-parsed."""
+    parquet_meta.clear_metadata_cache()
+    path = 'tests/data/planets.parquet'
+    cache_dir = tmp_path / 'cache'
+
+    first = parquet_meta.read_metadata_cached(path, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # a fresh process only has the on-disk copy
+    parquet_meta.clear_metadata_cache()
+    second = parquet_meta.read_metadata_cached(path, cache_dir=cache_dir)
+
+    assert second is not first
+    assert second == parquet_meta.read_metadata(path)
+    assert type(first['row_groups']) is type(second['row_groups']) is list
+
+
+def test_disk_cache_ignores_corrupt_entries(tmp_path):
+    """An unreadable cache file falls back to parsing the footer."""
+    parquet_meta.clear_metadata_cache()
+    path = 'tests/data/planets.parquet'
+    cache_dir = tmp_path / 'cache'
+
+    parquet_meta.read_metadata_cached(path, cache_dir=cache_dir)
+    entry = next(cache_dir.iterdir())
+    expected = parquet_meta.read_metadata(path)
+
+    foreign = [
+        b'not a pickle',
+        # references a module that does not exist
+        b'cno_such_module\nthing\n.',
+        pickle.dumps([1, 2, 3]),
+        pickle.dumps({'num_rows': 9}),
+    ]
+    for payload in foreign:
+        entry.write_bytes(payload)
+        parquet_meta.clear_metadata_cache()
+        assert parquet_meta.read_metadata_cached(path, cache_dir=cache_dir) == expected
+
+
+def test_prefetch_footers():
+    """Prefetching is advisory and tolerates files that cannot be opened."""
+    paths = ['tests/data/planets.parquet', 'tests/data/does-not-exist.parquet']
+
+    assert parquet_meta.prefetch_footers(paths) is None
+    assert parquet_meta.read_metadata('tests/data/planets.parquet')['num_rows'] == 9
@@ -2,6 +2,7 @@
 Tests for the rugo to orso schema converter.
 """
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -9,6 +10,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import rugo
 import rugo.parquet as parquet_meta
 
 # Try to import orso components
@@ -96,6 +98,15 @@ class TestOrsoConverter:
         for col_name, col_type in schema_info["columns"].items():
             assert isinstance(col_name, str)
             assert isinstance(col_type, str)
+
+    def test_extract_schema_only_from_schema(self):
+        """An already converted schema is reused rather than converted again."""
+        rugo_metadata = parquet_meta.read_metadata("tests/data/planets.parquet")
+        orso_schema = rugo_to_orso_schema(rugo_metadata, "test_schema")
+
+        assert extract_schema_only(orso_schema, "test_schema") == extract_schema_only(
+            rugo_metadata, "test_schema"
+        )
     
     def test_invalid_metadata(self):
         """Test error handling with invalid metadata."""
@@ -141,15 +152,47 @@ class TestOrsoConverter:
         assert orso_schema.columns[0].type == OrsoTypes.INTEGER
         assert not orso_schema.columns[0].nullable  # null_count is 0
 
+    def test_unknown_null_count(self):
+        """Columns without a null count are treated as nullable."""
+        metadata = {
+            "row_groups": [{
+                "columns": [{"name": "a", "type": "int64", "null_count": None}]
+            }]
+        }
+
+        orso_schema = rugo_to_orso_schema(metadata)
+
+        assert orso_schema.columns[0].nullable
+
+    def test_row_groups_sequence_matches_list(self):
+        """Metadata read by rugo converts the same as its plain list form."""
+        rugo_metadata = parquet_meta.read_metadata("tests/data/alltypes_plain.parquet")
+        as_list = dict(rugo_metadata, row_groups=list(rugo_metadata["row_groups"]))
+
+        expected = [(c.name, c.type, c.nullable) for c in rugo_to_orso_schema(as_list).columns]
+        actual = [(c.name, c.type, c.nullable) for c in rugo_to_orso_schema(rugo_metadata).columns]
+
+        assert actual == expected
+
 @pytest.mark.skipif(ORSO_AVAILABLE, reason="Testing ImportError handling")
 def test_import_without_orso():
     """Test that the module handles missing orso gracefully."""
     # This test runs when orso is not available
     # The import should not fail, but converter functions won't be available
-    import rugo
     assert 'rugo_to_orso_schema' not in rugo.__all__
 
 
+def test_converter_imported_lazily():
+    """Importing rugo.parquet does not import orso until a converter is used."""
+    code = (
+        "import sys, rugo.parquet, rugo; "
+        "assert 'orso' not in sys.modules; "
+        "rugo.__all__ and rugo.rugo_to_orso_schema; "
+        "assert bool(rugo.__all__) == ('orso' in sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
+
+
 def test_struct_handling():
     cve_path = "tests/data/185d5a679a475304.parquet"
     if not Path(cve_path).exists():
@@ -0,0 +1,108 @@
+"""
+Tests for skipping row groups using statistics and bloom filters.
+"""
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rugo.parquet as parquet_meta
+
+PLANETS = 'tests/data/planets.parquet'
+
+
+@pytest.fixture(scope="module")
+def clustered_file(tmp_path_factory):
+    """Three row groups of 100 rows with ids 0-299 and matching names."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    ids = list(range(300))
+    table = pa.table({'id': ids, 'name': [f'name-{i:03d}' for i in ids]})
+    file_path = str(tmp_path_factory.mktemp('pruning') / 'clustered.parquet')
+    try:
+        pq.write_table(table, file_path, row_group_size=100,
+                       bloom_filter_options={'name': {'ndv': 100}})
+    except TypeError:
+        pq.write_table(table, file_path, row_group_size=100)
+    return file_path
+
+
+def test_prune_by_min_max(clustered_file):
+    """Range predicates keep only row groups whose statistics overlap."""
+    row_groups = parquet_meta.read_metadata(clustered_file)['row_groups']
+
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '>', 250) == [2]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '>=', 199) == [1, 2]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '<', 100) == [0]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '<=', 100) == [0, 1]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '=', 150) == [1]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '!=', 150) == [0, 1, 2]
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'id', '>', 1000) == []
+
+
+def test_prune_equality_strings(clustered_file):
+    """String equality is pruned by statistics and then by bloom filters."""
+    row_groups = parquet_meta.read_metadata(clustered_file)['row_groups']
+
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'name', '=', 'name-042') == [0]
+    assert parquet_meta.prune_row_groups(clustered_file, list(row_groups), 'name', '==', 'name-242') == [2]
+    # inside the min/max range of row group 0 but never written
+    assert parquet_meta.prune_row_groups(clustered_file, row_groups, 'name', '=', 'name-042x') in ([], [0])
+
+
+def test_prune_keeps_legacy_string_stats(clustered_file):
+    """Strings with only the deprecated signed-order min/max never prune."""
+    row_groups = parquet_meta.read_metadata(clustered_file)['row_groups']
+    assert all(c['min_max_v2'] for rg in row_groups for c in rg['columns'])
+
+    legacy = [dict(rg, columns=[dict(c, min_max_v2=False) for c in rg['columns']]) for rg in row_groups]
+    assert parquet_meta.prune_row_groups(clustered_file, legacy, 'name', '>', 'name-250') == [0, 1, 2]
+    assert parquet_meta.prune_row_groups(clustered_file, legacy, 'id', '>', 250) == [2]
+
+    # {"a", "z", "é"} ordered as signed bytes puts "é" first
+    column = {'name': 'name', 'type': 'byte_array', 'logical_type': 'varchar',
+              'min': 'é', 'max': 'z', 'min_max_v2': False}
+    single = [{'columns': [column]}]
+    assert parquet_meta.prune_row_groups(clustered_file, single, 'name', '>', 'z') == [0]
+    assert parquet_meta.prune_row_groups(clustered_file, [{'columns': [dict(column, min_max_v2=True)]}],
+                                         'name', '>', 'z') == []
+
+
+def test_prune_keeps_int_backed_decimals(tmp_path):
+    """Decimal statistics are unscaled integers, so they never prune."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    prices = pa.array([Decimal('500.00'), Decimal('700.00')], pa.decimal128(9, 2))
+    file_path = str(tmp_path / 'decimal.parquet')
+    try:
+        pq.write_table(pa.table({'price': prices}), file_path, store_decimal_as_integer=True)
+    except TypeError:
+        pytest.skip("pyarrow cannot store decimals as integers")
+
+    row_groups = parquet_meta.read_metadata(file_path)['row_groups']
+    assert row_groups[0]['columns'][0]['type'] == 'int32'
+
+    assert parquet_meta.prune_row_groups(file_path, row_groups, 'price', '<', 800) == [0]
+    assert parquet_meta.prune_row_groups(file_path, row_groups, 'price', '<', Decimal('800')) == [0]
+    assert parquet_meta.prune_row_groups(file_path, row_groups, 'price', '=', Decimal('500.00')) == [0]
+
+
+def test_prune_keeps_unknowns():
+    """Unknown columns and incomparable values never skip a row group."""
+    row_groups = parquet_meta.read_metadata(PLANETS)['row_groups']
+
+    assert parquet_meta.prune_row_groups(PLANETS, row_groups, 'missing', '=', 1) == [0]
+    assert parquet_meta.prune_row_groups(PLANETS, row_groups, 'id', '>', 'text') == [0]
+    assert parquet_meta.prune_row_groups(PLANETS, row_groups, 'id', '>', 9) == []
+
+    with pytest.raises(ValueError, match="Unsupported comparison operator"):
+        parquet_meta.prune_row_groups(PLANETS, row_groups, 'id', '~', 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,139 @@
+"""
+Tests for the lazily materialized row group sequence.
+"""
+import pickle
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rugo.parquet as parquet_meta
+
+
+def test_row_groups_is_sequence():
+    """row_groups behaves like a read-only list of dictionaries."""
+    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
+    row_groups = metadata['row_groups']
+
+    assert isinstance(row_groups, Sequence)
+    assert len(row_groups) == 1
+    assert isinstance(row_groups[0], dict)
+    assert row_groups[0]['num_rows'] == 9
+    assert [rg['num_rows'] for rg in row_groups] == [9]
+    assert row_groups[0] in row_groups
+    assert list(reversed(row_groups)) == [row_groups[0]]
+    assert row_groups.index(dict(row_groups[0])) == 0
+    assert row_groups.count(row_groups[0]) == 1
+    assert row_groups.count({}) == 0
+    with pytest.raises(ValueError):
+        row_groups.index({})
+    with pytest.raises(ValueError):
+        row_groups.index(row_groups[0], 1)
+
+
+def test_row_groups_memoized():
+    """Each row group dictionary is built once and reused."""
+    row_groups = parquet_meta.read_metadata('tests/data/planets.parquet')['row_groups']
+
+    assert row_groups[0] is row_groups[0]
+    assert row_groups[-1] is row_groups[0]
+    assert row_groups[0:1] == [row_groups[0]]
+
+
+def test_row_groups_index_error():
+    """Out of range indexes raise IndexError."""
+    row_groups = parquet_meta.read_metadata('tests/data/planets.parquet')['row_groups']
+
+    with pytest.raises(IndexError):
+        row_groups[1]
+    with pytest.raises(IndexError):
+        row_groups[-2]
+
+
+def test_row_groups_equality_and_pickle():
+    """row_groups compares equal to the equivalent list and pickles as one."""
+    metadata = parquet_meta.read_metadata('tests/data/planets.parquet')
+    as_list = list(metadata['row_groups'])
+
+    assert metadata['row_groups'] == as_list
+    assert as_list == metadata['row_groups']
+    assert metadata['row_groups'] != []
+
+    restored = pickle.loads(pickle.dumps(metadata))
+    assert isinstance(restored['row_groups'], list)
+    assert restored == metadata
+
+
+def test_repeated_strings_shared(tmp_path):
+    """Names and types repeated across row groups of one read are shared objects."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = str(tmp_path / 'many.parquet')
+    pq.write_table(pa.table({'value': list(range(30))}), path, row_group_size=10)
+    first, second, _ = parquet_meta.read_metadata(path)['row_groups']
+
+    a, b = first['columns'][0], second['columns'][0]
+    assert a['name'] is b['name']
+    assert a['type'] is b['type']
+    assert a['compression_codec'] is b['compression_codec']
+    assert all(x is y for x, y in zip(a['encodings'], b['encodings']))
+
+    # sharing is scoped to one read, nothing is interned process-wide
+    other = parquet_meta.read_metadata(path)['row_groups'][0]['columns'][0]
+    assert other['name'] == a['name'] and other['name'] is not a['name']
+
+
+def test_column_projection():
+    """Projected reads keep only the requested columns, unchanged and in file order."""
+    path = 'tests/data/planets.parquet'
+    full = parquet_meta.read_metadata(path)['row_groups'][0]['columns']
+    projected = parquet_meta.read_metadata(path, columns=['name', 'id', 'missing'])
+
+    assert projected['row_groups'][0]['columns'] == [c for c in full if c['name'] in ('id', 'name')]
+    assert projected['row_groups'].columns_soa(0).names == ['id', 'name']
+    assert parquet_meta.read_metadata_from_bytes(Path(path).read_bytes(), columns=[])['row_groups'][0]['columns'] == []
+
+    with pytest.raises(TypeError):
+        parquet_meta.read_metadata(path, columns='id')
+
+
+def test_columns_soa_matches_columns():
+    """The parallel-array view carries the same values as the column dicts."""
+    for file_path in ('tests/data/planets.parquet', 'tests/data/data_index_bloom_encoding_stats.parquet'):
+        row_groups = parquet_meta.read_metadata(file_path)['row_groups']
+        soa = row_groups.columns_soa(0)
+        columns = row_groups[0]['columns']
+
+        assert soa.names == [c['name'] for c in columns]
+        assert soa.types == [c['type'] for c in columns]
+        assert soa.logical_types == [c['logical_type'] for c in columns]
+        assert list(soa.bloom_offsets) == [-1 if c['bloom_offset'] is None else c['bloom_offset'] for c in columns]
+        assert list(soa.bloom_lengths) == [-1 if c['bloom_length'] is None else c['bloom_length'] for c in columns]
+        assert list(soa.null_counts) == [-1 if c['null_count'] is None else c['null_count'] for c in columns]
+        assert soa.bloom_offsets.typecode == 'q'
+
+    with pytest.raises(IndexError):
+        row_groups.columns_soa(1)
+
+
+def test_iter_columns_matches_columns():
+    """Column descriptors carry the same values as the column dicts."""
+    path = 'tests/data/data_index_bloom_encoding_stats.parquet'
+    columns = parquet_meta.read_metadata(path)['row_groups'][0]['columns']
+    descriptors = list(parquet_meta.iter_columns(path))
+
+    fields = ['name', 'type', 'logical_type', 'num_values', 'null_count', 'bloom_offset', 'bloom_length']
+    assert [[getattr(d, f) for f in fields] for d in descriptors] == [[c[f] for f in fields] for c in columns]
+
+    with pytest.raises(AttributeError):
+        descriptors[0].name = 'other'
+    with pytest.raises(IndexError):
+        parquet_meta.iter_columns(path, row_group=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
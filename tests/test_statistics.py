@@ -11,7 +11,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import rugo.parquet as parquet_meta
 
-FILES = glob.glob("tests/data/*.parquet")
+# sorted so every pytest-xdist worker collects the same parameters
+FILES = sorted(glob.glob("tests/data/*.parquet"))
 
 def encode_value(val):
     # Strings are now returned as-is (UTF-8 decoded) to match rugo behavior
@@ -121,16 +122,13 @@ def run_one(file: str, iters=100) -> bool:
     print("✅ Results match")
     return True
 
-def test_compare_arrow_rugo():
-    for f in FILES:
-        if Path(f).exists():
-            # Skip files with list columns - known limitation with list column naming
-            if any(name in f for name in ['tweets.parquet', 'astronauts.parquet']):
-                print(f"\n⚠️  Skipping {f} - known limitation with list column naming")
-                continue
-            assert run_one(f)
-        else:
-            print(f"⚠️  Missing file {f}")
+@pytest.mark.parametrize("f", FILES, ids=lambda f: Path(f).name)
+def test_compare_arrow_rugo(f):
+    # FILES comes from a directory listing, so every entry exists
+    # Skip files with list columns - known limitation with list column naming
+    if any(name in f for name in ['tweets.parquet', 'astronauts.parquet']):
+        pytest.skip("known limitation with list column naming")
+    assert run_one(f)
 
 if __name__ == "__main__":
     pytest.main([__file__])
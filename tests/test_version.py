@@ -9,11 +9,11 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import rugo
+
 
 def test_version_exists():
     """Test that __version__ is defined."""
-    import rugo
-    
     assert hasattr(rugo, "__version__")
     assert isinstance(rugo.__version__, str)
     assert len(rugo.__version__) > 0
@@ -21,8 +21,6 @@ def test_version_exists():
 
 def test_version_format():
     """Test that version follows semantic versioning format."""
-    import rugo
-    
     # Should be in format like "0.1.1" or "0.1.1-dev"
     parts = rugo.__version__.split("-")[0].split(".")
     assert len(parts) >= 2, f"Version should have at least major.minor: {rugo.__version__}"
@@ -34,29 +32,24 @@ def test_version_format():
 
 def test_version_matches_pyproject():
     """Test that __version__ matches the version in pyproject.toml."""
-    import rugo
-    import tomllib
-    
-    # Read version from pyproject.toml
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    
+    # Read pyproject.toml once for either parser
+    data = (Path(__file__).parent.parent / "pyproject.toml").read_bytes()
+
     # Use tomllib (Python 3.11+) or fallback
     try:
-        with open(pyproject_path, "rb") as f:
-            pyproject_data = tomllib.load(f)
-    except (ImportError, AttributeError):
+        import tomllib
+    except ImportError:
         # Fallback for Python < 3.11
-        import re
-        with open(pyproject_path, "r") as f:
-            content = f.read()
-            match = re.search(r'^version\s*=\s*"([^"]+)"', content, re.MULTILINE)
-            if match:
-                pyproject_version = match.group(1)
-            else:
-                pytest.skip("Could not parse version from pyproject.toml")
-                return
+        for line in data.decode("utf-8").splitlines():
+            key, sep, value = line.partition("=")
+            if sep and key.strip() == "version":
+                pyproject_version = value.strip().strip('"')
+                break
+        else:
+            pytest.skip("Could not parse version from pyproject.toml")
+            return
     else:
-        pyproject_version = pyproject_data["project"]["version"]
+        pyproject_version = tomllib.loads(data.decode("utf-8"))["project"]["version"]
     
     # Compare versions
     assert rugo.__version__ == pyproject_version, (